@@ -118,7 +118,10 @@ export class GameEngine {
         // Create renderer with 64-bit HDR color support
         this.renderer = new THREE.WebGLRenderer({
             canvas: this.canvas,
-            antialias: true,
+            // The canvas only receives the composer's final full-screen pass
+            // (anti-aliased by FXAA, which stays on even with effects disabled),
+            // so a multisampled default framebuffer is wasted
+            antialias: false,
             alpha: false,
             precision: 'highp', // High precision for 64-bit rendering
             powerPreference: 'high-performance',
@@ -230,6 +233,31 @@ export class GameEngine {
         }
     }
 
+    /**
+     * Compile every material's shaders and upload its textures to the GPU
+     * Called once the world is built so the first rendered frames don't stall
+     * on shader compilation or texture uploads. Shaders link asynchronously
+     * where the driver supports it, so the loading screen keeps painting.
+     */
+    async precompile(): Promise<void> {
+        if (!this.renderer || !this.scene || !this.camera) return;
+
+        await this.renderer.compileAsync(this.scene, this.camera);
+
+        const textures = new Set<THREE.Texture>();
+        this.scene.traverse((object) => {
+            const material = (object as THREE.Mesh).material;
+            if (!material) return;
+            for (const m of Array.isArray(material) ? material : [material]) {
+                const map = (m as THREE.MeshStandardMaterial).map;
+                if (map) textures.add(map);
+            }
+        });
+        for (const texture of textures) {
+            this.renderer.initTexture(texture);
+        }
+    }
+
     /**
      * Hide loading screen
      */
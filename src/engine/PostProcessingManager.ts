@@ -116,6 +116,7 @@ export class PostProcessingManager {
         const outputPass = new OutputPass();
         this.composer.addPass(outputPass);
         this.passes.output = outputPass;
+        this.applyEffectsEnabled();
 
         console.log('Post-processing pipeline initialized with 64-bit HDR support');
     }
@@ -129,9 +130,12 @@ export class PostProcessingManager {
 
     /**
      * Render the post-processing pipeline
+     * The composer runs even while effects are disabled: its FXAA pass is the
+     * only anti-aliasing (the canvas has no MSAA). Rendering falls back to the
+     * renderer directly, un-antialiased, only if init() has not run.
      */
     render(): void {
-        if (this.enabled && this.composer) {
+        if (this.composer) {
             this.composer.render();
         } else {
             this.renderer.render(this.scene, this.camera);
@@ -160,10 +164,24 @@ export class PostProcessingManager {
     }
 
     /**
-     * Enable/disable post-processing
+     * Enable/disable post-processing effects (SSAO, bloom)
+     * FXAA and the output conversion always stay on
      */
     setEnabled(enabled: boolean): void {
         this.enabled = enabled;
+        this.applyEffectsEnabled();
+    }
+
+    /**
+     * Switch the optional effect passes to match the enabled state
+     */
+    private applyEffectsEnabled(): void {
+        if (this.passes.ssao) {
+            this.passes.ssao.enabled = this.enabled;
+        }
+        if (this.passes.bloom) {
+            this.passes.bloom.enabled = this.enabled;
+        }
     }
 
     /**
@@ -4,8 +4,13 @@
  */
 
 import * as THREE from 'three';
+import { mergeGeometries } from 'three/examples/jsm/utils/BufferGeometryUtils.js';
 import { ENEMY_SPEED, ENEMY_TYPES, ITEMS } from '../utils/Constants';
 import { ENEMY_DATA } from '../data/EnemyData';
+import { NameTagCache } from '../utils/NameTagCache';
+import { RandomTable } from '../utils/RandomTable';
+import { Steering } from '../utils/Steering';
+import { getOrCreate, disposeAll } from '../utils/ResourceCache';
 import type { EnemyData, OSRSItem } from '../types/index';
 import type { Player } from './Player';
 
@@ -28,23 +33,52 @@ interface LootItem {
 
 /**
  * Enemy body parts for animation
+ * Every field is always present (null when a species lacks the part) so all
+ * enemies share one object shape and update() stays monomorphic
  */
 interface EnemyBodyParts {
-    body?: THREE.Mesh;
-    leftLeg?: THREE.Mesh;
-    rightLeg?: THREE.Mesh;
+    body: THREE.Mesh | null;
+    leftLeg: THREE.Mesh | null;
+    rightLeg: THREE.Mesh | null;
 }
 
+/**
+ * Shared enemy geometries and materials. Geometry is keyed by part and size
+ * so every enemy of the same species and size reuses one set of buffers.
+ */
+const ENEMY_GEOMETRIES: Map<string, THREE.BufferGeometry> = new Map();
+const ENEMY_MATERIALS: Map<string, THREE.Material> = new Map();
+
+/**
+ * Species mesh builder (bound to the enemy being built)
+ */
+type MeshBuilder = (this: Enemy, group: THREE.Group, size: number) => void;
+
 /**
  * Enemy class - Hostile creatures
  */
 export class Enemy {
+    /**
+     * Species mesh builders, matched against the enemy type in order
+     */
+    private static readonly MESH_BUILDERS: ReadonlyArray<[string, MeshBuilder]> = [
+        ['CHICKEN', Enemy.prototype.createChickenMesh],
+        ['COW', Enemy.prototype.createCowMesh],
+        ['GOBLIN', Enemy.prototype.createGoblinMesh]
+    ];
+
+    /**
+     * Builder resolved per enemy type (null means the generic box mesh)
+     */
+    private static meshBuilderCache: Map<string, MeshBuilder | null> = new Map();
+
     // Position and movement
     position: THREE.Vector3;
     startPosition: THREE.Vector3;
     rotation: number;
     speed: number;
     targetPosition: THREE.Vector3 | null;
+    private wanderTarget: THREE.Vector3;
     isWandering: boolean;
 
     // Identity
@@ -124,8 +158,9 @@ export class Enemy {
         // Wander behavior
         this.wanderRadius = 15;
         this.wanderTimer = 0;
-        this.wanderCooldown = Math.random() * 3 + 2;
+        this.wanderCooldown = RandomTable.range(2, 5);
         this.targetPosition = null;
+        this.wanderTarget = new THREE.Vector3();
         this.isWandering = false;
 
         // Aggression (from ENEMY_DATA)
@@ -137,7 +172,7 @@ export class Enemy {
 
         // 3D
         this.mesh = null;
-        this.bodyParts = {};
+        this.bodyParts = { body: null, leftLeg: null, rightLeg: null };
         this.hpBarBg = null;
         this.hpBarFill = null;
         this.nameSprite = null;
@@ -187,33 +222,32 @@ export class Enemy {
         const size = (this.enemyData as EnemyData).size || 0.6;
 
         // Determine which mesh to create based on enemy type
-        if (this.enemyType.includes('CHICKEN')) {
-            this.createChickenMesh(group, size);
-        } else if (this.enemyType.includes('COW')) {
-            this.createCowMesh(group, size);
-        } else if (this.enemyType.includes('GOBLIN')) {
-            this.createGoblinMesh(group, size);
+        const builder = Enemy.getMeshBuilder(this.enemyType);
+        if (builder) {
+            builder.call(this, group, size);
         } else {
             this.createGenericMesh(group, bodyColor, size);
         }
 
+        // Only the legs move relative to the creature: bake the other parts' matrices once
+        const { leftLeg, rightLeg } = this.bodyParts;
+        for (const part of group.children) {
+            if (part !== leftLeg && part !== rightLeg) {
+                part.updateMatrix();
+                part.matrixAutoUpdate = false;
+            }
+        }
+
         // HP bar (above creature)
         this.createHPBar(group);
 
-        // Name tag
-        const canvas = document.createElement('canvas');
-        const context = canvas.getContext('2d');
-        if (context) {
-            canvas.width = 256;
-            canvas.height = 64;
-            context.fillStyle = this.aggressive ? '#FF0000' : '#FFFF00';
-            context.font = 'Bold 20px Arial';
-            context.textAlign = 'center';
-            context.fillText(`${this.name} (${this.level})`, 128, 40);
-
-            const texture = new THREE.CanvasTexture(canvas);
-            const spriteMaterial = new THREE.SpriteMaterial({ map: texture });
-            const sprite = new THREE.Sprite(spriteMaterial);
+        // Name tag (shared texture per distinct label)
+        const sprite = NameTagCache.createSprite(
+            `${this.name} (${this.level})`,
+            this.aggressive ? '#FF0000' : '#FFFF00',
+            'Bold 20px Arial'
+        );
+        if (sprite) {
             sprite.position.y = 2.5;
             sprite.scale.set(2, 0.5, 1);
             group.add(sprite);
@@ -227,125 +261,132 @@ export class Enemy {
         this.mesh.userData.enemyType = this.enemyType;
     }
 
+    /**
+     * Look up the species mesh builder for an enemy type, resolving it once per type
+     */
+    private static getMeshBuilder(enemyType: string): MeshBuilder | null {
+        let builder = Enemy.meshBuilderCache.get(enemyType);
+        if (builder === undefined) {
+            const match = Enemy.MESH_BUILDERS.find(([keyword]) => enemyType.includes(keyword));
+            builder = match ? match[1] : null;
+            Enemy.meshBuilderCache.set(enemyType, builder);
+        }
+        return builder;
+    }
+
     /**
      * Create chicken mesh
      */
     private createChickenMesh(group: THREE.Group, size: number): void {
-        const bodyGeometry = new THREE.SphereGeometry(size * 0.6, 12, 12);
-        const bodyMaterial = new THREE.MeshStandardMaterial({
+        const bodyGeometry = getOrCreate(ENEMY_GEOMETRIES, `chicken_body_${size}`, () => new THREE.SphereGeometry(size * 0.6, 12, 12));
+        const bodyMaterial = getOrCreate(ENEMY_MATERIALS, 'chicken_body', () => new THREE.MeshStandardMaterial({
             color: 0xFFFFCC,
             roughness: 0.9,
             metalness: 0.0
-        });
+        }));
         const body = new THREE.Mesh(bodyGeometry, bodyMaterial);
         body.position.y = size * 0.7;
         body.scale.set(1, 1.2, 1);
         body.castShadow = true;
         group.add(body);
 
-        const headGeometry = new THREE.SphereGeometry(size * 0.3, 10, 10);
+        const headGeometry = getOrCreate(ENEMY_GEOMETRIES, `chicken_head_${size}`, () => new THREE.SphereGeometry(size * 0.3, 10, 10));
         const head = new THREE.Mesh(headGeometry, bodyMaterial);
         head.position.set(0, size * 1.1, size * 0.4);
         head.castShadow = true;
         group.add(head);
 
-        const beakGeometry = new THREE.ConeGeometry(size * 0.1, size * 0.2, 8);
-        const beakMaterial = new THREE.MeshStandardMaterial({
+        const beakGeometry = getOrCreate(ENEMY_GEOMETRIES, `chicken_beak_${size}`, () => new THREE.ConeGeometry(size * 0.1, size * 0.2, 8));
+        const beakMaterial = getOrCreate(ENEMY_MATERIALS, 'chicken_beak', () => new THREE.MeshStandardMaterial({
             color: 0xFF6347,
             roughness: 0.6,
             metalness: 0.0
-        });
+        }));
         const beak = new THREE.Mesh(beakGeometry, beakMaterial);
         beak.position.set(0, size * 1.0, size * 0.65);
         beak.rotation.x = Math.PI / 2;
         group.add(beak);
 
-        this.bodyParts = { body };
+        this.bodyParts = { body, leftLeg: null, rightLeg: null };
     }
 
     /**
      * Create cow mesh
      */
     private createCowMesh(group: THREE.Group, size: number): void {
-        const bodyGeometry = new THREE.BoxGeometry(size * 1.2, size * 0.8, size * 0.8);
-        const bodyMaterial = new THREE.MeshStandardMaterial({
+        const bodyGeometry = getOrCreate(ENEMY_GEOMETRIES, `cow_body_${size}`, () => new THREE.BoxGeometry(size * 1.2, size * 0.8, size * 0.8));
+        const bodyMaterial = getOrCreate(ENEMY_MATERIALS, 'cow_body', () => new THREE.MeshStandardMaterial({
             color: 0xA0826D,
             roughness: 0.8,
             metalness: 0.0
-        });
+        }));
         const body = new THREE.Mesh(bodyGeometry, bodyMaterial);
         body.position.y = size * 0.8;
         body.castShadow = true;
         group.add(body);
 
-        const headGeometry = new THREE.BoxGeometry(size * 0.6, size * 0.5, size * 0.5);
+        const headGeometry = getOrCreate(ENEMY_GEOMETRIES, `cow_head_${size}`, () => new THREE.BoxGeometry(size * 0.6, size * 0.5, size * 0.5));
         const head = new THREE.Mesh(headGeometry, bodyMaterial);
         head.position.set(0, size * 0.9, size * 0.9);
         head.castShadow = true;
         group.add(head);
 
-        const legGeometry = new THREE.CylinderGeometry(size * 0.15, size * 0.15, size * 0.6, 8);
-        const legMaterial = new THREE.MeshStandardMaterial({
+        // The four legs never animate, so they are baked into one geometry (one draw call)
+        const legsGeometry = getOrCreate(ENEMY_GEOMETRIES, `cow_legs_${size}`, () => mergeGeometries([
+            new THREE.CylinderGeometry(size * 0.15, size * 0.15, size * 0.6, 8).translate(-size * 0.4, size * 0.3, -size * 0.3),
+            new THREE.CylinderGeometry(size * 0.15, size * 0.15, size * 0.6, 8).translate(size * 0.4, size * 0.3, -size * 0.3),
+            new THREE.CylinderGeometry(size * 0.15, size * 0.15, size * 0.6, 8).translate(-size * 0.4, size * 0.3, size * 0.3),
+            new THREE.CylinderGeometry(size * 0.15, size * 0.15, size * 0.6, 8).translate(size * 0.4, size * 0.3, size * 0.3)
+        ])!);
+        const legMaterial = getOrCreate(ENEMY_MATERIALS, 'cow_leg', () => new THREE.MeshStandardMaterial({
             color: 0x654321,
             roughness: 0.7,
             metalness: 0.0
-        });
-
-        const positions: [number, number, number][] = [
-            [-size * 0.4, size * 0.3, -size * 0.3],
-            [size * 0.4, size * 0.3, -size * 0.3],
-            [-size * 0.4, size * 0.3, size * 0.3],
-            [size * 0.4, size * 0.3, size * 0.3]
-        ];
-
-        positions.forEach(pos => {
-            const leg = new THREE.Mesh(legGeometry, legMaterial);
-            leg.position.set(...pos);
-            leg.castShadow = true;
-            group.add(leg);
-        });
-
-        this.bodyParts = { body };
+        }));
+
+        const legs = new THREE.Mesh(legsGeometry, legMaterial);
+        legs.castShadow = true;
+        group.add(legs);
+
+        this.bodyParts = { body, leftLeg: null, rightLeg: null };
     }
 
     /**
      * Create goblin mesh
      */
     private createGoblinMesh(group: THREE.Group, size: number): void {
-        const bodyGeometry = new THREE.BoxGeometry(size * 0.7, size, size * 0.5);
-        const bodyMaterial = new THREE.MeshStandardMaterial({
+        const bodyGeometry = getOrCreate(ENEMY_GEOMETRIES, `goblin_body_${size}`, () => new THREE.BoxGeometry(size * 0.7, size, size * 0.5));
+        const bodyMaterial = getOrCreate(ENEMY_MATERIALS, 'goblin_body', () => new THREE.MeshStandardMaterial({
             color: 0x6B8E23,
             roughness: 0.7,
             metalness: 0.0
-        });
+        }));
         const body = new THREE.Mesh(bodyGeometry, bodyMaterial);
         body.position.y = size * 1.0;
         body.castShadow = true;
         group.add(body);
 
-        const headGeometry = new THREE.SphereGeometry(size * 0.35, 12, 12);
-        const headMaterial = new THREE.MeshStandardMaterial({
+        const headGeometry = getOrCreate(ENEMY_GEOMETRIES, `goblin_head_${size}`, () => new THREE.SphereGeometry(size * 0.35, 12, 12));
+        const headMaterial = getOrCreate(ENEMY_MATERIALS, 'goblin_head', () => new THREE.MeshStandardMaterial({
             color: 0x8FBC8F,
             roughness: 0.8,
             metalness: 0.0
-        });
+        }));
         const head = new THREE.Mesh(headGeometry, headMaterial);
         head.position.y = size * 1.8;
         head.castShadow = true;
         group.add(head);
 
-        const eyeGeometry = new THREE.SphereGeometry(size * 0.08, 8, 8);
-        const eyeMaterial = new THREE.MeshBasicMaterial({ color: 0xFF0000 });
-        const leftEye = new THREE.Mesh(eyeGeometry, eyeMaterial);
-        leftEye.position.set(-size * 0.15, size * 1.85, size * 0.3);
-        group.add(leftEye);
-
-        const rightEye = new THREE.Mesh(eyeGeometry, eyeMaterial);
-        rightEye.position.set(size * 0.15, size * 1.85, size * 0.3);
-        group.add(rightEye);
+        const eyesGeometry = getOrCreate(ENEMY_GEOMETRIES, `goblin_eyes_${size}`, () => mergeGeometries([
+            new THREE.SphereGeometry(size * 0.08, 8, 8).translate(-size * 0.15, size * 1.85, size * 0.3),
+            new THREE.SphereGeometry(size * 0.08, 8, 8).translate(size * 0.15, size * 1.85, size * 0.3)
+        ])!);
+        const eyeMaterial = getOrCreate(ENEMY_MATERIALS, 'goblin_eye', () => new THREE.MeshBasicMaterial({ color: 0xFF0000 }));
+        const eyes = new THREE.Mesh(eyesGeometry, eyeMaterial);
+        group.add(eyes);
 
-        const legGeometry = new THREE.BoxGeometry(size * 0.25, size * 0.8, size * 0.25);
-        const legMaterial = new THREE.MeshLambertMaterial({ color: 0x6B8E23 });
+        const legGeometry = getOrCreate(ENEMY_GEOMETRIES, `goblin_leg_${size}`, () => new THREE.BoxGeometry(size * 0.25, size * 0.8, size * 0.25));
+        const legMaterial = getOrCreate(ENEMY_MATERIALS, 'goblin_leg', () => new THREE.MeshLambertMaterial({ color: 0x6B8E23 }));
 
         const leftLeg = new THREE.Mesh(legGeometry, legMaterial);
         leftLeg.position.set(-size * 0.2, size * 0.4, 0);
@@ -357,46 +398,56 @@ export class Enemy {
         rightLeg.castShadow = true;
         group.add(rightLeg);
 
-        this.bodyParts = { leftLeg, rightLeg, body };
+        this.bodyParts = { body, leftLeg, rightLeg };
     }
 
     /**
      * Create generic mesh
      */
     private createGenericMesh(group: THREE.Group, color: number, size: number): void {
-        const geometry = new THREE.BoxGeometry(size, size, size);
-        const material = new THREE.MeshStandardMaterial({
+        const geometry = getOrCreate(ENEMY_GEOMETRIES, `generic_${size}`, () => new THREE.BoxGeometry(size, size, size));
+        const material = getOrCreate(ENEMY_MATERIALS, `generic_${color}`, () => new THREE.MeshStandardMaterial({
             color: color,
             roughness: 0.8,
             metalness: 0.0
-        });
+        }));
         const mesh = new THREE.Mesh(geometry, material);
         mesh.position.y = size / 2;
         mesh.castShadow = true;
         group.add(mesh);
-        this.bodyParts = { body: mesh };
+        this.bodyParts = { body: mesh, leftLeg: null, rightLeg: null };
     }
 
     /**
      * Create HP bar
      */
     private createHPBar(group: THREE.Group): void {
-        const bgGeometry = new THREE.PlaneGeometry(1.5, 0.2);
-        const bgMaterial = new THREE.MeshBasicMaterial({ color: 0x8B0000 });
-        const bgBar = new THREE.Mesh(bgGeometry, bgMaterial);
+        const barGeometry = getOrCreate(ENEMY_GEOMETRIES, 'hp_bar', () => new THREE.PlaneGeometry(1.5, 0.2));
+        const bgMaterial = getOrCreate(ENEMY_MATERIALS, 'hp_bar_bg', () => new THREE.MeshBasicMaterial({ color: 0x8B0000 }));
+        const bgBar = new THREE.Mesh(barGeometry, bgMaterial);
         bgBar.position.y = 2.2;
         group.add(bgBar);
 
-        const fillGeometry = new THREE.PlaneGeometry(1.5, 0.2);
-        const fillMaterial = new THREE.MeshBasicMaterial({ color: 0x00FF00 });
-        const fillBar = new THREE.Mesh(fillGeometry, fillMaterial);
-        fillBar.position.set(0, 2.21, 0.01);
-        group.add(fillBar);
+        // Fill rides on the background so the pair billboards as one. Click
+        // resolvers look at the hit object and its parent, so the background
+        // carries the enemy too for hits on the fill.
+        bgBar.userData.type = 'enemy';
+        bgBar.userData.entity = this;
+        const fillBar = new THREE.Mesh(barGeometry, Enemy.getHPBarMaterial(0x00FF00));
+        fillBar.position.set(0, 0.01, 0.01);
+        bgBar.add(fillBar);
 
         this.hpBarBg = bgBar;
         this.hpBarFill = fillBar;
     }
 
+    /**
+     * Get the shared HP bar fill material for a color
+     */
+    private static getHPBarMaterial(color: number): THREE.Material {
+        return getOrCreate(ENEMY_MATERIALS, `hp_bar_${color}`, () => new THREE.MeshBasicMaterial({ color }));
+    }
+
     /**
      * Update HP bar
      */
@@ -407,13 +458,13 @@ export class Enemy {
         this.hpBarFill.scale.x = hpPercent;
         this.hpBarFill.position.x = -(1.5 * (1 - hpPercent)) / 2;
 
-        const material = this.hpBarFill.material as THREE.MeshBasicMaterial;
+        // Swap between the shared fill materials rather than recoloring one
         if (hpPercent > 0.5) {
-            material.color.setHex(0x00FF00);
+            this.hpBarFill.material = Enemy.getHPBarMaterial(0x00FF00);
         } else if (hpPercent > 0.25) {
-            material.color.setHex(0xFFFF00);
+            this.hpBarFill.material = Enemy.getHPBarMaterial(0xFFFF00);
         } else {
-            material.color.setHex(0xFF0000);
+            this.hpBarFill.material = Enemy.getHPBarMaterial(0xFF0000);
         }
     }
 
@@ -478,8 +529,12 @@ export class Enemy {
 
     /**
      * Update enemy (called every frame)
+     * @param inView - Whether the enemy is on screen; off-screen enemies skip
+     *                 walk animation and HP bar/name billboarding
+     * @param now - Frame timestamp in ms driving the walk animation; the world
+     *              reads the clock once per frame and passes it to every enemy
      */
-    update(delta: number, player?: Player): void {
+    update(delta: number, player?: Player, inView: boolean = true, now: number = Date.now()): void {
         // Respawn logic
         if (this.isDead) {
             this.respawnTimer -= delta;
@@ -491,38 +546,41 @@ export class Enemy {
 
         // Aggression check
         if (this.aggressive && player && !this.inCombat) {
-            const distance = this.position.distanceTo(player.position);
-            if (distance < this.aggroRange) {
+            if (this.position.distanceToSquared(player.position) < this.aggroRange * this.aggroRange) {
                 this.target = player;
                 this.inCombat = true;
             }
         }
 
+        // Legs are looked up once; every branch below may animate or reset them
+        const { leftLeg, rightLeg } = this.bodyParts;
+
         // Combat movement
         if (this.inCombat && this.target) {
-            const direction = new THREE.Vector3()
-                .subVectors(this.target.position, this.position)
-                .normalize();
-
-            const distance = this.position.distanceTo(this.target.position);
+            const dx = this.target.position.x - this.position.x;
+            const dz = this.target.position.z - this.position.z;
+            const distanceSq = dx * dx + dz * dz;
 
-            if (distance > 20) {
+            // Leash (20) and melee range (1.5) compare squared; sqrt only when stepping
+            if (distanceSq > 20 * 20) {
                 this.inCombat = false;
                 this.target = null;
 
-                if (this.bodyParts.leftLeg && this.bodyParts.rightLeg) {
-                    this.bodyParts.leftLeg.rotation.x = 0;
-                    this.bodyParts.rightLeg.rotation.x = 0;
+                if (leftLeg && rightLeg) {
+                    leftLeg.rotation.x = 0;
+                    rightLeg.rotation.x = 0;
                 }
-            } else if (distance > 1.5) {
-                this.position.addScaledVector(direction, this.speed * delta);
-                this.rotation = Math.atan2(direction.x, direction.z);
+            } else if (distanceSq > 1.5 * 1.5) {
+                const step = (this.speed * delta) / Math.sqrt(distanceSq);
+                this.position.x += dx * step;
+                this.position.z += dz * step;
+                this.rotation = Math.atan2(dx, dz);
 
-                if (this.bodyParts.leftLeg && this.bodyParts.rightLeg) {
+                if (inView && leftLeg && rightLeg) {
                     const walkSpeed = 10;
-                    const leftLegRotation = Math.sin(Date.now() * 0.01 * walkSpeed) * 0.4;
-                    this.bodyParts.leftLeg.rotation.x = leftLegRotation;
-                    this.bodyParts.rightLeg.rotation.x = -leftLegRotation;
+                    const leftLegRotation = Math.sin(now * 0.01 * walkSpeed) * 0.4;
+                    leftLeg.rotation.x = leftLegRotation;
+                    rightLeg.rotation.x = -leftLegRotation;
                 }
             }
         } else {
@@ -530,41 +588,31 @@ export class Enemy {
             this.wanderTimer += delta;
 
             if (this.wanderTimer >= this.wanderCooldown) {
-                const angle = Math.random() * Math.PI * 2;
-                const wanderDistance = Math.random() * this.wanderRadius;
-                const targetX = this.startPosition.x + Math.cos(angle) * wanderDistance;
-                const targetZ = this.startPosition.z + Math.sin(angle) * wanderDistance;
-
-                this.targetPosition = new THREE.Vector3(targetX, 0, targetZ);
+                this.targetPosition = Steering.pickWanderTarget(this.startPosition, this.wanderRadius, this.wanderTarget);
                 this.isWandering = true;
                 this.wanderTimer = 0;
-                this.wanderCooldown = Math.random() * 3 + 2;
+                this.wanderCooldown = RandomTable.range(2, 5);
             }
 
             if (this.isWandering && this.targetPosition) {
-                const direction = new THREE.Vector3()
-                    .subVectors(this.targetPosition, this.position)
-                    .normalize();
-
-                const distance = this.position.distanceTo(this.targetPosition);
+                const heading = Steering.stepTowards(this.position, this.targetPosition, this.speed * 0.5 * delta, 0.3);
 
-                if (distance < 0.3) {
+                if (heading === null) {
                     this.isWandering = false;
                     this.targetPosition = null;
 
-                    if (this.bodyParts.leftLeg && this.bodyParts.rightLeg) {
-                        this.bodyParts.leftLeg.rotation.x = 0;
-                        this.bodyParts.rightLeg.rotation.x = 0;
+                    if (leftLeg && rightLeg) {
+                        leftLeg.rotation.x = 0;
+                        rightLeg.rotation.x = 0;
                     }
                 } else {
-                    this.position.addScaledVector(direction, (this.speed * 0.5) * delta);
-                    this.rotation = Math.atan2(direction.x, direction.z);
+                    this.rotation = heading;
 
-                    if (this.bodyParts.leftLeg && this.bodyParts.rightLeg) {
+                    if (inView && leftLeg && rightLeg) {
                         const walkSpeed = 8;
-                        const leftLegRotation = Math.sin(Date.now() * 0.01 * walkSpeed) * 0.3;
-                        this.bodyParts.leftLeg.rotation.x = leftLegRotation;
-                        this.bodyParts.rightLeg.rotation.x = -leftLegRotation;
+                        const leftLegRotation = Math.sin(now * 0.01 * walkSpeed) * 0.3;
+                        leftLeg.rotation.x = leftLegRotation;
+                        rightLeg.rotation.x = -leftLegRotation;
                     }
                 }
             }
@@ -577,10 +625,9 @@ export class Enemy {
 
             // Make HP bar and name face camera
             const gameCamera = (window as unknown as { gameCamera?: THREE.Camera }).gameCamera;
-            if (gameCamera) {
-                if (this.hpBarBg && this.hpBarFill) {
+            if (inView && gameCamera) {
+                if (this.hpBarBg) {
                     this.hpBarBg.lookAt(gameCamera.position);
-                    this.hpBarFill.lookAt(gameCamera.position);
                 }
                 if (this.nameSprite) {
                     this.nameSprite.lookAt(gameCamera.position);
@@ -613,31 +660,25 @@ export class Enemy {
     }
 
     /**
-     * Dispose of enemy resources (geometries, materials, textures)
+     * Dispose the geometry and materials shared by all enemies and empty the
+     * caches, so enemies built afterwards get fresh ones (world teardown)
+     */
+    static disposeShared(): void {
+        disposeAll(ENEMY_GEOMETRIES);
+        disposeAll(ENEMY_MATERIALS);
+    }
+
+    /**
+     * Dispose of enemy resources
+     * Geometry, materials and name tags are shared between enemies and are not
+     * disposed here (see disposeShared)
      */
     dispose(): void {
-        if (this.mesh) {
-            this.mesh.traverse((object) => {
-                if (object instanceof THREE.Mesh) {
-                    object.geometry.dispose();
-                    if (Array.isArray(object.material)) {
-                        object.material.forEach(material => material.dispose());
-                    } else {
-                        object.material.dispose();
-                    }
-                } else if (object instanceof THREE.Sprite) {
-                    if (object.material.map) {
-                        object.material.map.dispose();
-                    }
-                    object.material.dispose();
-                }
-            });
-            this.mesh = null;
-        }
+        this.mesh = null;
         this.hpBarBg = null;
         this.hpBarFill = null;
         this.nameSprite = null;
-        this.bodyParts = {};
+        this.bodyParts = { body: null, leftLeg: null, rightLeg: null };
     }
 }
 
@@ -4,8 +4,13 @@
  */
 
 import * as THREE from 'three';
+import { mergeGeometries } from 'three/examples/jsm/utils/BufferGeometryUtils.js';
 import { NPC_SPEED, NPC_TYPES, COLORS } from '../utils/Constants';
 import { NPC_DATA } from '../data/NPCData';
+import { NameTagCache } from '../utils/NameTagCache';
+import { RandomTable } from '../utils/RandomTable';
+import { Steering } from '../utils/Steering';
+import { getOrCreate, disposeAll } from '../utils/ResourceCache';
 import type { NPCData, NPCDialogue } from '../types/index';
 
 /**
@@ -16,6 +21,26 @@ interface NPCBodyParts {
     rightLeg: THREE.Mesh;
 }
 
+/**
+ * Shared NPC body geometry. Every NPC uses the same proportions, so the
+ * buffers are built once and reused by all instances. Both eyes are baked
+ * into one geometry since they never move independently (one draw, not two).
+ */
+const NPC_GEOMETRIES = {
+    body: new THREE.BoxGeometry(0.7, 1.1, 0.5),
+    head: new THREE.SphereGeometry(0.35, 12, 12),
+    eyes: mergeGeometries([
+        new THREE.SphereGeometry(0.06, 6, 6).translate(-0.12, 2.05, 0.3),
+        new THREE.SphereGeometry(0.06, 6, 6).translate(0.12, 2.05, 0.3)
+    ])!,
+    leg: new THREE.BoxGeometry(0.25, 0.8, 0.25)
+};
+
+/**
+ * Shared NPC materials keyed by name (body materials keyed by color)
+ */
+const NPC_MATERIALS: Map<string, THREE.Material> = new Map();
+
 /**
  * NPC class - Non-player characters
  */
@@ -26,6 +51,7 @@ export class NPC {
     rotation: number;
     speed: number;
     targetPosition: THREE.Vector3 | null;
+    private wanderTarget: THREE.Vector3;
     isWandering: boolean;
 
     // Identity
@@ -68,8 +94,9 @@ export class NPC {
         this.wanderRadius = this.npcData?.wanderRadius ?? 10;
         this.roaming = this.npcData?.roaming !== false;
         this.wanderTimer = 0;
-        this.wanderCooldown = Math.random() * 5 + 3; // 3-8 seconds
+        this.wanderCooldown = RandomTable.range(3, 8); // 3-8 seconds
         this.targetPosition = null;
+        this.wanderTarget = new THREE.Vector3();
         this.isWandering = false;
 
         // Dialogue
@@ -181,77 +208,65 @@ export class NPC {
         else if (this.type === NPC_TYPES.FATHER_AERECK) bodyColor = 0x808080;
 
         // Body
-        const bodyGeometry = new THREE.BoxGeometry(0.7, 1.1, 0.5);
-        const bodyMaterial = new THREE.MeshStandardMaterial({
+        const bodyMaterial = getOrCreate(NPC_MATERIALS, `body_${bodyColor}`, () => new THREE.MeshStandardMaterial({
             color: bodyColor,
             roughness: 0.8,
             metalness: 0.0
-        });
-        const body = new THREE.Mesh(bodyGeometry, bodyMaterial);
+        }));
+        const body = new THREE.Mesh(NPC_GEOMETRIES.body, bodyMaterial);
         body.position.y = 1.15;
         body.castShadow = true;
         group.add(body);
 
         // Head
-        const headGeometry = new THREE.SphereGeometry(0.35, 12, 12);
-        const headMaterial = new THREE.MeshStandardMaterial({
+        const headMaterial = getOrCreate(NPC_MATERIALS, 'head', () => new THREE.MeshStandardMaterial({
             color: 0xFFDBB5,
             roughness: 0.9,
             metalness: 0.0
-        });
-        const head = new THREE.Mesh(headGeometry, headMaterial);
+        }));
+        const head = new THREE.Mesh(NPC_GEOMETRIES.head, headMaterial);
         head.position.y = 2.0;
         head.castShadow = true;
         group.add(head);
 
         // Eyes
-        const eyeGeometry = new THREE.SphereGeometry(0.06, 6, 6);
-        const eyeMaterial = new THREE.MeshBasicMaterial({ color: 0x000000 });
-        const leftEye = new THREE.Mesh(eyeGeometry, eyeMaterial);
-        leftEye.position.set(-0.12, 2.05, 0.3);
-        group.add(leftEye);
-
-        const rightEye = new THREE.Mesh(eyeGeometry, eyeMaterial);
-        rightEye.position.set(0.12, 2.05, 0.3);
-        group.add(rightEye);
+        const eyeMaterial = getOrCreate(NPC_MATERIALS, 'eye', () => new THREE.MeshBasicMaterial({ color: 0x000000 }));
+        const eyes = new THREE.Mesh(NPC_GEOMETRIES.eyes, eyeMaterial);
+        group.add(eyes);
 
         // Legs
-        const legGeometry = new THREE.BoxGeometry(0.25, 0.8, 0.25);
-        const legMaterial = new THREE.MeshStandardMaterial({
+        const legMaterial = getOrCreate(NPC_MATERIALS, 'leg', () => new THREE.MeshStandardMaterial({
             color: 0x654321,
             roughness: 0.7,
             metalness: 0.0
-        });
+        }));
 
-        const leftLeg = new THREE.Mesh(legGeometry, legMaterial);
+        const leftLeg = new THREE.Mesh(NPC_GEOMETRIES.leg, legMaterial);
         leftLeg.position.set(-0.2, 0.4, 0);
         leftLeg.castShadow = true;
         group.add(leftLeg);
 
-        const rightLeg = new THREE.Mesh(legGeometry, legMaterial);
+        const rightLeg = new THREE.Mesh(NPC_GEOMETRIES.leg, legMaterial);
         rightLeg.position.set(0.2, 0.4, 0);
         rightLeg.castShadow = true;
         group.add(rightLeg);
 
-        // Name tag
-        const canvas = document.createElement('canvas');
-        const context = canvas.getContext('2d');
-        if (context) {
-            canvas.width = 256;
-            canvas.height = 64;
-            context.fillStyle = '#FFFF00';
-            context.font = 'Bold 24px Arial';
-            context.textAlign = 'center';
-            context.fillText(this.name, 128, 40);
-
-            const texture = new THREE.CanvasTexture(canvas);
-            const spriteMaterial = new THREE.SpriteMaterial({ map: texture });
-            const sprite = new THREE.Sprite(spriteMaterial);
+        // Name tag (shared texture per distinct name)
+        const sprite = NameTagCache.createSprite(this.name, '#FFFF00', 'Bold 24px Arial');
+        if (sprite) {
             sprite.position.y = 3.0;
             sprite.scale.set(2, 0.5, 1);
             group.add(sprite);
         }
 
+        // Only the legs move relative to the NPC: bake the other parts' matrices once
+        for (const part of group.children) {
+            if (part !== leftLeg && part !== rightLeg) {
+                part.updateMatrix();
+                part.matrixAutoUpdate = false;
+            }
+        }
+
         group.position.copy(this.position);
         this.mesh = group;
         this.mesh.userData.entity = this;
@@ -287,49 +302,42 @@ export class NPC {
 
     /**
      * Update NPC (called every frame)
+     * @param inView - Whether the NPC is on screen; off-screen NPCs skip walk animation
+     * @param now - Frame timestamp in ms driving the walk animation
      */
-    update(delta: number): void {
+    update(delta: number, inView: boolean = true, now: number = Date.now()): void {
         // Wander behavior
         this.wanderTimer += delta;
 
         if (this.wanderTimer >= this.wanderCooldown) {
             // Pick random point within wander radius
-            const angle = Math.random() * Math.PI * 2;
-            const distance = Math.random() * this.wanderRadius;
-            const targetX = this.startPosition.x + Math.cos(angle) * distance;
-            const targetZ = this.startPosition.z + Math.sin(angle) * distance;
-
-            this.targetPosition = new THREE.Vector3(targetX, 0, targetZ);
+            this.targetPosition = Steering.pickWanderTarget(this.startPosition, this.wanderRadius, this.wanderTarget);
             this.isWandering = true;
             this.wanderTimer = 0;
-            this.wanderCooldown = Math.random() * 5 + 3;
+            this.wanderCooldown = RandomTable.range(3, 8);
         }
 
         // Move to target
         if (this.isWandering && this.targetPosition && this.bodyParts) {
-            const direction = new THREE.Vector3()
-                .subVectors(this.targetPosition, this.position)
-                .normalize();
-
-            const distance = this.position.distanceTo(this.targetPosition);
+            const heading = Steering.stepTowards(this.position, this.targetPosition, this.speed * delta, 0.3);
 
-            if (distance < 0.3) {
+            if (heading === null) {
                 this.isWandering = false;
                 this.targetPosition = null;
+                this.resetLegs();
             } else {
-                this.position.addScaledVector(direction, this.speed * delta);
-                this.rotation = Math.atan2(direction.x, direction.z);
+                this.rotation = heading;
 
                 // Animate walking
-                const walkSpeed = 8;
-                const leftLegRotation = Math.sin(Date.now() * 0.01 * walkSpeed) * 0.4;
-                this.bodyParts.leftLeg.rotation.x = leftLegRotation;
-                this.bodyParts.rightLeg.rotation.x = -leftLegRotation;
+                if (inView) {
+                    const walkSpeed = 8;
+                    const leftLegRotation = Math.sin(now * 0.01 * walkSpeed) * 0.4;
+                    this.bodyParts.leftLeg.rotation.x = leftLegRotation;
+                    this.bodyParts.rightLeg.rotation.x = -leftLegRotation;
+                }
             }
-        } else if (this.bodyParts) {
-            // Reset leg positions
-            this.bodyParts.leftLeg.rotation.x = 0;
-            this.bodyParts.rightLeg.rotation.x = 0;
+        } else {
+            this.resetLegs();
         }
 
         // Update mesh
@@ -339,6 +347,28 @@ export class NPC {
         }
     }
 
+    /**
+     * Advance a standing NPC that is not yet due to wander without a full
+     * update: only its idle timer moves, since its legs and mesh are already
+     * at rest
+     * @returns false if the NPC is walking or due to pick a target, and needs update()
+     */
+    tickIdle(delta: number): boolean {
+        if (this.isWandering || this.wanderTimer + delta >= this.wanderCooldown) return false;
+        this.wanderTimer += delta;
+        return true;
+    }
+
+    /**
+     * Put both legs back to standing
+     */
+    private resetLegs(): void {
+        if (this.bodyParts) {
+            this.bodyParts.leftLeg.rotation.x = 0;
+            this.bodyParts.rightLeg.rotation.x = 0;
+        }
+    }
+
     /**
      * Face a specific direction
      */
@@ -357,30 +387,28 @@ export class NPC {
     stopWandering(): void {
         this.isWandering = false;
         this.targetPosition = null;
+        this.resetLegs();
     }
 
     /**
-     * Dispose of NPC resources (geometries, materials, textures)
+     * Dispose the geometry and materials shared by all NPCs and empty the
+     * material cache (world teardown). The body geometry objects stay valid:
+     * three.js uploads them again if an NPC is built afterwards.
      */
-    dispose(): void {
-        if (this.mesh) {
-            this.mesh.traverse((object) => {
-                if (object instanceof THREE.Mesh) {
-                    object.geometry.dispose();
-                    if (Array.isArray(object.material)) {
-                        object.material.forEach(material => material.dispose());
-                    } else {
-                        object.material.dispose();
-                    }
-                } else if (object instanceof THREE.Sprite) {
-                    if (object.material.map) {
-                        object.material.map.dispose();
-                    }
-                    object.material.dispose();
-                }
-            });
-            this.mesh = null;
+    static disposeShared(): void {
+        for (const geometry of Object.values(NPC_GEOMETRIES)) {
+            geometry.dispose();
         }
+        disposeAll(NPC_MATERIALS);
+    }
+
+    /**
+     * Dispose of NPC resources
+     * Geometry, materials and name tags are shared between NPCs and are not
+     * disposed here (see disposeShared)
+     */
+    dispose(): void {
+        this.mesh = null;
         this.bodyParts = null;
     }
 }
@@ -4,8 +4,10 @@
  */
 
 import * as THREE from 'three';
+import { mergeGeometries } from 'three/examples/jsm/utils/BufferGeometryUtils.js';
 import { PLAYER_SPEED, SKILLS, COLORS, EQUIPMENT_SLOTS, EQUIPMENT_BONUSES, FOOD_HEALING } from '../utils/Constants';
 import { XPCalculator } from '../utils/XPCalculator';
+import { NameTagCache } from '../utils/NameTagCache';
 import type { SkillName, Skills, SkillData, Equipment, OSRSItem, EquipmentSlot } from '../types/index';
 
 /**
@@ -48,6 +50,7 @@ export class Player {
     targetPosition: THREE.Vector3 | null;
     isMoving: boolean;
     speed: number;
+    private moveTarget: THREE.Vector3;
 
     // Skills
     skills: Record<SkillName, SkillData>;
@@ -78,6 +81,7 @@ export class Player {
         this.targetPosition = null;
         this.isMoving = false;
         this.speed = PLAYER_SPEED;
+        this.moveTarget = new THREE.Vector3();
 
         // RuneScape skills
         this.skills = {
@@ -171,16 +175,16 @@ export class Player {
         head.receiveShadow = true;
         group.add(head);
 
-        // Eyes
-        const eyeGeometry = new THREE.SphereGeometry(0.08, 8, 8);
+        // Eyes (both baked into one geometry: they never move independently)
+        const eyeParts = [
+            new THREE.SphereGeometry(0.08, 8, 8).translate(-0.15, 2.25, 0.35),
+            new THREE.SphereGeometry(0.08, 8, 8).translate(0.15, 2.25, 0.35)
+        ];
+        const eyeGeometry = mergeGeometries(eyeParts)!;
+        eyeParts.forEach(part => part.dispose());
         const eyeMaterial = new THREE.MeshBasicMaterial({ color: 0x000000 });
-        const leftEye = new THREE.Mesh(eyeGeometry, eyeMaterial);
-        leftEye.position.set(-0.15, 2.25, 0.35);
-        group.add(leftEye);
-
-        const rightEye = new THREE.Mesh(eyeGeometry, eyeMaterial);
-        rightEye.position.set(0.15, 2.25, 0.35);
-        group.add(rightEye);
+        const eyes = new THREE.Mesh(eyeGeometry, eyeMaterial);
+        group.add(eyes);
 
         // Legs - PBR material
         const legGeometry = new THREE.BoxGeometry(0.3, 0.9, 0.3);
@@ -219,19 +223,8 @@ export class Player {
         group.add(rightArm);
 
         // Name tag
-        const canvas = document.createElement('canvas');
-        const context = canvas.getContext('2d');
-        if (context) {
-            canvas.width = 256;
-            canvas.height = 64;
-            context.fillStyle = '#FFFF00';
-            context.font = 'Bold 32px Arial';
-            context.textAlign = 'center';
-            context.fillText('Player', 128, 40);
-
-            const texture = new THREE.CanvasTexture(canvas);
-            const spriteMaterial = new THREE.SpriteMaterial({ map: texture });
-            const sprite = new THREE.Sprite(spriteMaterial);
+        const sprite = NameTagCache.createSprite('Player', '#FFFF00', 'Bold 32px Arial');
+        if (sprite) {
             sprite.position.y = 3.5;
             sprite.scale.set(2, 0.5, 1);
             group.add(sprite);
@@ -255,7 +248,8 @@ export class Player {
      * Move to target position
      */
     moveTo(x: number, z: number): void {
-        this.targetPosition = new THREE.Vector3(x, 0, z);
+        // Reuse one vector: combat re-issues moveTo every tick while chasing
+        this.targetPosition = this.moveTarget.set(x, 0, z);
         this.isMoving = true;
     }
 
@@ -335,21 +329,21 @@ export class Player {
     update(delta: number): void {
         // Movement
         if (this.isMoving && this.targetPosition) {
-            const direction = new THREE.Vector3()
-                .subVectors(this.targetPosition, this.position)
-                .normalize();
-
-            const distance = this.position.distanceTo(this.targetPosition);
+            const dx = this.targetPosition.x - this.position.x;
+            const dz = this.targetPosition.z - this.position.z;
+            const distance = Math.sqrt(dx * dx + dz * dz);
 
             if (distance < 0.5) {
                 this.position.copy(this.targetPosition);
                 this.isMoving = false;
                 this.targetPosition = null;
             } else {
-                this.position.addScaledVector(direction, this.speed * delta);
+                const step = (this.speed * delta) / distance;
+                this.position.x += dx * step;
+                this.position.z += dz * step;
 
                 // Update rotation to face movement direction
-                this.rotation = Math.atan2(direction.x, direction.z);
+                this.rotation = Math.atan2(dx, dz);
 
                 // Animate walking
                 if (this.bodyParts) {
@@ -609,7 +603,8 @@ export class Player {
     }
 
     /**
-     * Dispose of player resources (geometries, materials, textures)
+     * Dispose of player resources (geometries, materials)
+     * The name tag material is shared via NameTagCache and is not disposed here
      */
     dispose(): void {
         if (this.mesh) {
@@ -621,11 +616,6 @@ export class Player {
                     } else {
                         object.material.dispose();
                     }
-                } else if (object instanceof THREE.Sprite) {
-                    if (object.material.map) {
-                        object.material.map.dispose();
-                    }
-                    object.material.dispose();
                 }
             });
             this.mesh = null;
@@ -26,6 +26,10 @@ export class CameraController {
     private angle: number;
     private rotation: number;
 
+    // Player position and orbit the camera was last placed for
+    private followed: THREE.Vector3;
+    private orbitChanged: boolean;
+
     constructor(config: CameraControllerConfig) {
         this.camera = config.camera;
         this.getPlayer = config.getPlayer;
@@ -33,6 +37,9 @@ export class CameraController {
         this.distance = CAMERA.DEFAULT_DISTANCE;
         this.angle = CAMERA.DEFAULT_ANGLE;
         this.rotation = 0;
+
+        this.followed = new THREE.Vector3();
+        this.orbitChanged = true;
     }
 
     /**
@@ -69,6 +76,7 @@ export class CameraController {
     rotate(deltaX: number, deltaY: number): void {
         this.rotation -= deltaX * 0.005;
         this.angle = Math.max(0.1, Math.min(Math.PI / 2.5, this.angle + deltaY * 0.005));
+        this.orbitChanged = true;
         this.update();
     }
 
@@ -80,16 +88,23 @@ export class CameraController {
             CAMERA.MIN_DISTANCE,
             Math.min(CAMERA.MAX_DISTANCE, this.distance + delta * 0.01)
         );
+        this.orbitChanged = true;
         this.update();
     }
 
     /**
      * Update camera position to follow player
+     * Called every frame; does nothing while the player stands still and the
+     * orbit (distance, angle, rotation) is unchanged
      */
     update(): void {
         const player = this.getPlayer();
         if (!player) return;
 
+        if (!this.orbitChanged && this.followed.equals(player.position)) return;
+        this.orbitChanged = false;
+        this.followed.copy(player.position);
+
         const height = this.distance * Math.sin(this.angle);
         const horizontalDistance = this.distance * Math.cos(this.angle);
 
@@ -107,6 +122,7 @@ export class CameraController {
         this.distance = CAMERA.DEFAULT_DISTANCE;
         this.angle = CAMERA.DEFAULT_ANGLE;
         this.rotation = 0;
+        this.orbitChanged = true;
         this.update();
     }
 
@@ -115,6 +131,7 @@ export class CameraController {
      */
     setDistance(distance: number): void {
         this.distance = Math.max(CAMERA.MIN_DISTANCE, Math.min(CAMERA.MAX_DISTANCE, distance));
+        this.orbitChanged = true;
         this.update();
     }
 
@@ -123,6 +140,7 @@ export class CameraController {
      */
     setAngle(angle: number): void {
         this.angle = Math.max(0.1, Math.min(Math.PI / 2.5, angle));
+        this.orbitChanged = true;
         this.update();
     }
 
@@ -131,6 +149,7 @@ export class CameraController {
      */
     setRotation(rotation: number): void {
         this.rotation = rotation;
+        this.orbitChanged = true;
         this.update();
     }
 }
@@ -4,6 +4,7 @@
  */
 
 import * as THREE from 'three';
+import { NameTagCache } from '../utils/NameTagCache';
 
 /**
  * Damage splash data
@@ -55,7 +56,7 @@ export class DamageSplashManager {
         context.textAlign = 'center';
         context.fillText(text, 64, 40);
 
-        const texture = new THREE.CanvasTexture(canvas);
+        const texture = NameTagCache.createTexture(canvas);
         const material = new THREE.SpriteMaterial({
             map: texture,
             transparent: true
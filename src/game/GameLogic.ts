@@ -16,6 +16,7 @@ import { TutorialSystem } from '../systems/TutorialSystem';
 import { SaveSystem } from '../systems/SaveSystem';
 import { UIManager } from '../ui/UIManager';
 import { ITEMS } from '../utils/Constants';
+import { NameTagCache } from '../utils/NameTagCache';
 import { InputHandler } from './InputHandler';
 import { CameraController } from './CameraController';
 import { DamageSplashManager } from './DamageSplashManager';
@@ -217,6 +218,10 @@ export class GameLogic {
             console.log('Init: Setting up event listeners...');
             this.setupEventListeners();
 
+            // Compile shaders and upload textures before the first frame
+            console.log('Init: Precompiling materials...');
+            await this.engine.precompile();
+
             this.engine.updateLoadingProgress(100);
             console.log('Init: Hiding loading screen...');
             this.engine.hideLoadingScreen();
@@ -635,6 +640,9 @@ export class GameLogic {
             this.player.dispose();
         }
 
+        // Release shared name tag textures
+        NameTagCache.clear();
+
         // Clear references to systems
         this.combatSystem = null;
         this.skillsSystem = null;
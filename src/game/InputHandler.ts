@@ -3,6 +3,9 @@
  * Extracted from GameLogic for better separation of concerns
  */
 
+import { inWorldBounds } from '../utils/WorldBounds';
+import { isMovementKey, resolveMoveDirection } from '../utils/MovementKeys';
+import type { MoveDirection } from '../utils/MovementKeys';
 import type { Player } from '../entities/Player';
 import type { CombatSystem } from '../systems/CombatSystem';
 
@@ -27,6 +30,7 @@ export interface InputHandlerConfig {
  */
 export class InputHandler {
     private keys: KeyState;
+    private move: MoveDirection;
     private mouseDown: boolean;
     private lastMouseX: number;
     private lastMouseY: number;
@@ -42,6 +46,7 @@ export class InputHandler {
 
     constructor(config: InputHandlerConfig) {
         this.keys = {};
+        this.move = { x: 0, z: 0 };
         this.mouseDown = false;
         this.lastMouseX = 0;
         this.lastMouseY = 0;
@@ -86,52 +91,49 @@ export class InputHandler {
      * Handle keyboard movement
      */
     handleMovement(delta: number): void {
+        let dx = this.move.x;
+        let dz = this.move.z;
+
+        // Nothing held (the common case): skip the player/combat lookups entirely
+        if (dx === 0 && dz === 0) return;
+
         const player = this.config.getPlayer();
         const combatSystem = this.config.getCombatSystem();
         if (!player || !combatSystem) return;
 
-        let dx = 0;
-        let dz = 0;
-
-        if (this.keys['KeyW'] || this.keys['ArrowUp']) dz -= 1;
-        if (this.keys['KeyS'] || this.keys['ArrowDown']) dz += 1;
-        if (this.keys['KeyA'] || this.keys['ArrowLeft']) dx -= 1;
-        if (this.keys['KeyD'] || this.keys['ArrowRight']) dx += 1;
-
-        if (dx !== 0 || dz !== 0) {
-            // Normalize diagonal movement
-            const length = Math.sqrt(dx * dx + dz * dz);
-            dx /= length;
-            dz /= length;
-
-            // Move player
-            const newX = player.position.x + dx * player.speed * delta;
-            const newZ = player.position.z + dz * player.speed * delta;
-
-            // Bounds check
-            const bound = 140;
-            if (newX > -bound && newX < bound && newZ > -bound && newZ < bound) {
-                player.position.x = newX;
-                player.position.z = newZ;
-                player.rotation = Math.atan2(dx, dz);
-
-                // Stop combat when moving manually
-                if (player.inCombat && player.target) {
-                    combatSystem.stopCombat();
-                }
-
-                // Notify movement for tutorial tracking
-                this.config.onMovement?.();
+        // Normalize diagonal movement
+        const length = Math.sqrt(dx * dx + dz * dz);
+        dx /= length;
+        dz /= length;
+
+        // Move player
+        const newX = player.position.x + dx * player.speed * delta;
+        const newZ = player.position.z + dz * player.speed * delta;
+
+        // Bounds check
+        if (inWorldBounds(newX, newZ)) {
+            player.position.x = newX;
+            player.position.z = newZ;
+            player.rotation = Math.atan2(dx, dz);
+
+            // Stop combat when moving manually
+            if (player.inCombat && player.target) {
+                combatSystem.stopCombat();
             }
+
+            // Notify movement for tutorial tracking
+            this.config.onMovement?.();
         }
     }
 
     private handleKeyDown(e: KeyboardEvent): void {
         this.keys[e.code] = true;
+        if (isMovementKey(e.code)) resolveMoveDirection(this.keys, this.move);
     }
 
     private handleKeyUp(e: KeyboardEvent): void {
         this.keys[e.code] = false;
+        if (isMovementKey(e.code)) resolveMoveDirection(this.keys, this.move);
     }
 
     private handleMouseDown(e: MouseEvent): void {
@@ -176,6 +178,8 @@ export class InputHandler {
         window.removeEventListener('mousemove', this.boundMouseMove);
         window.removeEventListener('wheel', this.boundWheel);
         this.keys = {};
+        this.move.x = 0;
+        this.move.z = 0;
         this.mouseDown = false;
     }
 }
@@ -3,6 +3,9 @@
  * Extracted from GameLogic to reduce god object complexity
  */
 
+import { inWorldBounds } from '../utils/WorldBounds';
+import { isMovementKey, resolveMoveDirection } from '../utils/MovementKeys';
+import type { MoveDirection } from '../utils/MovementKeys';
 import type { Player } from '../entities/Player';
 import type { CombatSystem } from '../systems/CombatSystem';
 
@@ -21,6 +24,7 @@ export interface IInputManager {
  */
 export class InputManager implements IInputManager {
     private _keys: Record<string, boolean> = {};
+    private move: MoveDirection = { x: 0, z: 0 };
 
     // Event handler references for cleanup
     private handleKeyDown: (e: KeyboardEvent) => void;
@@ -28,12 +32,15 @@ export class InputManager implements IInputManager {
 
     constructor() {
         // Initialize event handlers
+        // Movement keys re-resolve the direction here rather than every frame
         this.handleKeyDown = (e: KeyboardEvent) => {
             this._keys[e.code] = true;
+            if (isMovementKey(e.code)) resolveMoveDirection(this._keys, this.move);
         };
 
         this.handleKeyUp = (e: KeyboardEvent) => {
             this._keys[e.code] = false;
+            if (isMovementKey(e.code)) resolveMoveDirection(this._keys, this.move);
         };
     }
 
@@ -60,13 +67,8 @@ export class InputManager implements IInputManager {
     handleMovement(delta: number, player: Player, combatSystem: CombatSystem | null): void {
         if (!player) return;
 
-        let dx = 0;
-        let dz = 0;
-
-        if (this._keys['KeyW'] || this._keys['ArrowUp']) dz -= 1;
-        if (this._keys['KeyS'] || this._keys['ArrowDown']) dz += 1;
-        if (this._keys['KeyA'] || this._keys['ArrowLeft']) dx -= 1;
-        if (this._keys['KeyD'] || this._keys['ArrowRight']) dx += 1;
+        let dx = this.move.x;
+        let dz = this.move.z;
 
         if (dx !== 0 || dz !== 0) {
             // Normalize diagonal movement
@@ -79,8 +81,7 @@ export class InputManager implements IInputManager {
             const newZ = player.position.z + dz * player.speed * delta;
 
             // Bounds check
-            const bound = 140;
-            if (Math.abs(newX) < bound && Math.abs(newZ) < bound) {
+            if (inWorldBounds(newX, newZ)) {
                 player.position.x = newX;
                 player.position.z = newZ;
                 player.rotation = Math.atan2(dx, dz);
@@ -103,6 +104,8 @@ export class InputManager implements IInputManager {
         window.removeEventListener('keyup', this.handleKeyUp);
 
         this._keys = {};
+        this.move.x = 0;
+        this.move.z = 0;
     }
 }
 
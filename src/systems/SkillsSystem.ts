@@ -59,11 +59,13 @@ export class SkillsSystem {
     private gameLogic: ISkillsSystemContext;
     private player: Player;
     private resources: Resource[];
+    private depletedResources: Resource[];
 
     constructor(gameLogic: ISkillsSystemContext) {
         this.gameLogic = gameLogic;
         this.player = gameLogic.player;
         this.resources = [];
+        this.depletedResources = [];
     }
 
     /**
@@ -71,6 +73,9 @@ export class SkillsSystem {
      */
     addResource(resource: Resource): void {
         this.resources.push(resource);
+        if (resource.depleted) {
+            this.depletedResources.push(resource);
+        }
     }
 
     /**
@@ -81,6 +86,11 @@ export class SkillsSystem {
         if (index > -1) {
             this.resources.splice(index, 1);
         }
+
+        const depletedIndex = this.depletedResources.indexOf(resource);
+        if (depletedIndex > -1) {
+            this.depletedResources.splice(depletedIndex, 1);
+        }
     }
 
     /**
@@ -155,6 +165,10 @@ export class SkillsSystem {
             // Check if resource is depleted
             if (resource.hp <= 0) {
                 resource.deplete();
+                // Some nodes (fishing spots) never deplete; queue each depleted node once
+                if (resource.depleted && this.resources.includes(resource) && !this.depletedResources.includes(resource)) {
+                    this.depletedResources.push(resource);
+                }
             }
         } else {
             this.gameLogic.ui.addMessage(
@@ -212,13 +226,15 @@ export class SkillsSystem {
      * Update skills system (called every frame)
      */
     update(delta: number): void {
-        // Update resource respawn timers
-        for (const resource of this.resources) {
-            if (resource.depleted) {
-                resource.respawnTimer -= delta;
-                if (resource.respawnTimer <= 0) {
-                    resource.respawn();
-                }
+        // Update respawn timers (only depleted resources are tracked here)
+        const depleted = this.depletedResources;
+        for (let i = depleted.length - 1; i >= 0; i--) {
+            const resource = depleted[i];
+            resource.respawnTimer -= delta;
+            if (resource.respawnTimer <= 0) {
+                resource.respawn();
+                depleted[i] = depleted[depleted.length - 1];
+                depleted.pop();
             }
         }
     }
@@ -235,6 +251,7 @@ export class SkillsSystem {
      */
     clearResources(): void {
         this.resources = [];
+        this.depletedResources = [];
     }
 
     /**
@@ -8,7 +8,7 @@ import type { Player } from '../entities/Player';
 import type { NPC } from '../entities/NPC';
 import type { Enemy } from '../entities/Enemy';
 import type { IShopSystemContext } from '../types/game';
-import type { EquipmentSlot } from '../types/index';
+import type { EquipmentSlot, SkillName } from '../types/index';
 
 /**
  * Context menu option interface
@@ -18,6 +18,55 @@ interface ContextMenuOption {
     action: () => void;
 }
 
+/**
+ * Cached references to the stats panel elements
+ */
+interface StatsElements {
+    hpBar: HTMLElement | null;
+    hpText: HTMLElement | null;
+    prayerBar: HTMLElement | null;
+    prayerText: HTMLElement | null;
+    combatLvlText: HTMLElement | null;
+    skills: Array<{ skill: SkillName; index: number; level: Element | null; xp: Element | null }>;
+}
+
+/**
+ * Last values shown by the stats panel: HP, max HP, prayer, max prayer,
+ * then level and XP for each skill in order, plus which skills changed in
+ * the latest snapshot (1 = changed)
+ */
+interface StatsSnapshot {
+    skills: SkillName[];
+    values: Float64Array;
+    changedSkills: Uint8Array;
+}
+
+/**
+ * Cached minimap canvas context and projection, plus the marker pixel
+ * positions last drawn (used to skip repaints when nothing moved)
+ */
+interface MinimapView {
+    ctx: CanvasRenderingContext2D;
+    width: number;
+    height: number;
+    scale: number;
+    centerX: number;
+    centerY: number;
+    markers: Int16Array;
+    drawn: Int16Array;
+    drawnLength: number;
+}
+
+/**
+ * Store a value in a snapshot slot
+ * @returns Whether it differs from the value previously stored there
+ */
+function recordValue(values: Float64Array, index: number, value: number): boolean {
+    if (values[index] === value) return false;
+    values[index] = value;
+    return true;
+}
+
 /**
  * Message type
  */
@@ -30,6 +79,12 @@ export class UIManager {
     private gameLogic: IShopSystemContext;
     private player: Player;
     private currentTab: string;
+    private barWidths: WeakMap<HTMLElement, number> = new WeakMap();
+    private minimap: MinimapView | null = null;
+    private statsElements: StatsElements | null = null;
+    private slotMarkup: string[] = [];
+    private equippedNames: WeakMap<HTMLElement, string> = new WeakMap();
+    private statsSnapshot: StatsSnapshot | null = null;
 
     constructor(gameLogic: IShopSystemContext) {
         this.gameLogic = gameLogic;
@@ -171,56 +226,142 @@ export class UIManager {
         }
     }
 
+    /**
+     * Set an element's text, skipping the DOM write when it is unchanged
+     */
+    private setText(element: Element, text: string): void {
+        if (element.textContent !== text) {
+            element.textContent = text;
+        }
+    }
+
+    /**
+     * Set an element's width in percent, skipping the style write when it is unchanged
+     */
+    private setWidthPercent(element: HTMLElement, percent: number): void {
+        // Compare against the last value written; style.width reads back normalized
+        if (this.barWidths.get(element) !== percent) {
+            this.barWidths.set(element, percent);
+            element.style.width = percent + '%';
+        }
+    }
+
+    /**
+     * Get the stats panel elements, looked up once and cached
+     */
+    private getStatsElements(): StatsElements {
+        if (!this.statsElements) {
+            const skills: StatsElements['skills'] = [];
+            const skillNames = Object.keys(this.player.skills) as SkillName[];
+            for (let index = 0; index < skillNames.length; index++) {
+                const skill = skillNames[index];
+                const skillItem = document.querySelector(`.skill-item[data-skill="${skill}"]`);
+                if (skillItem) {
+                    skills.push({
+                        skill,
+                        index,
+                        level: skillItem.querySelector('.skill-level'),
+                        xp: skillItem.querySelector('.skill-xp')
+                    });
+                }
+            }
+
+            this.statsElements = {
+                hpBar: document.getElementById('hp-bar'),
+                hpText: document.getElementById('hp-text'),
+                prayerBar: document.getElementById('prayer-bar'),
+                prayerText: document.getElementById('prayer-text'),
+                combatLvlText: document.getElementById('combat-lvl-text'),
+                skills
+            };
+        }
+        return this.statsElements;
+    }
+
+    /**
+     * Record the player's current stats in the snapshot
+     * @returns Whether any value differs from the previous snapshot
+     */
+    private snapshotStats(): boolean {
+        const player = this.player;
+        if (!this.statsSnapshot) {
+            const skills = Object.keys(player.skills) as SkillName[];
+            this.statsSnapshot = {
+                skills,
+                values: new Float64Array(4 + skills.length * 2).fill(NaN),
+                changedSkills: new Uint8Array(skills.length)
+            };
+        }
+
+        const { skills, values, changedSkills } = this.statsSnapshot;
+        let changed = recordValue(values, 0, player.currentHP);
+        changed = recordValue(values, 1, player.skills.hitpoints.level) || changed;
+        changed = recordValue(values, 2, player.currentPrayer) || changed;
+        changed = recordValue(values, 3, player.skills.prayer.level) || changed;
+        for (let i = 0; i < skills.length; i++) {
+            const skillData = player.skills[skills[i]];
+            const levelChanged = recordValue(values, 4 + i * 2, skillData.level);
+            const xpChanged = recordValue(values, 5 + i * 2, skillData.xp);
+            changedSkills[i] = levelChanged || xpChanged ? 1 : 0;
+            changed = levelChanged || xpChanged || changed;
+        }
+        return changed;
+    }
+
     /**
      * Update player stats display
+     * Called every frame; returns straight away unless a stat changed since
+     * the last call, and then only elements whose value changed are written to
      */
     updateStats(): void {
+        if (!this.snapshotStats()) return;
+
+        const { hpBar, hpText, prayerBar, prayerText, combatLvlText } = this.getStatsElements();
+
         // HP bar
-        const hpBar = document.getElementById('hp-bar');
-        const hpText = document.getElementById('hp-text');
         if (hpBar && hpText) {
             const hpPercent = (this.player.currentHP / this.player.skills.hitpoints.level) * 100;
-            hpBar.style.width = hpPercent + '%';
-            hpText.textContent = `${this.player.currentHP}/${this.player.skills.hitpoints.level}`;
+            this.setWidthPercent(hpBar, hpPercent);
+            this.setText(hpText, `${this.player.currentHP}/${this.player.skills.hitpoints.level}`);
         }
 
         // Prayer bar
-        const prayerBar = document.getElementById('prayer-bar');
-        const prayerText = document.getElementById('prayer-text');
         if (prayerBar && prayerText) {
             const prayerPercent = (this.player.currentPrayer / this.player.skills.prayer.level) * 100;
-            prayerBar.style.width = prayerPercent + '%';
-            prayerText.textContent = `${this.player.currentPrayer}/${this.player.skills.prayer.level}`;
+            this.setWidthPercent(prayerBar, prayerPercent);
+            this.setText(prayerText, `${this.player.currentPrayer}/${this.player.skills.prayer.level}`);
         }
 
         // Combat level
-        const combatLvlText = document.getElementById('combat-lvl-text');
         if (combatLvlText) {
-            combatLvlText.textContent = this.player.getCombatLevel().toString();
+            this.setText(combatLvlText, this.player.getCombatLevel().toString());
         }
 
-        // Update skill list
-        this.updateSkillsList();
+        // Update only the skill rows whose level or XP moved
+        const { changedSkills } = this.statsSnapshot!;
+        for (const { skill, index, level, xp } of this.getStatsElements().skills) {
+            if (!changedSkills[index]) continue;
+            const skillData = this.player.skills[skill];
+            if (level) this.setText(level, skillData.level.toString());
+            if (xp) this.setText(xp, `${skillData.xp} XP`);
+        }
     }
 
     /**
      * Update skills list
      */
     updateSkillsList(): void {
-        for (const [skillName, skillData] of Object.entries(this.player.skills)) {
-            const skillItem = document.querySelector(`.skill-item[data-skill="${skillName}"]`);
-            if (skillItem) {
-                const levelSpan = skillItem.querySelector('.skill-level');
-                const xpSpan = skillItem.querySelector('.skill-xp');
-
-                if (levelSpan) levelSpan.textContent = skillData.level.toString();
-                if (xpSpan) xpSpan.textContent = `${skillData.xp} XP`;
-            }
+        for (const { skill, level, xp } of this.getStatsElements().skills) {
+            const skillData = this.player.skills[skill];
+            if (level) this.setText(level, skillData.level.toString());
+            if (xp) this.setText(xp, `${skillData.xp} XP`);
         }
     }
 
     /**
      * Update inventory display
+     * Each slot remembers the markup it last rendered and is only re-parsed
+     * when its item or count changed
      */
     updateInventory(): void {
         const slots = document.querySelectorAll('.inventory-slot');
@@ -230,24 +371,26 @@ export class UIManager {
             if (!slot) continue;
 
             const item = this.player.inventory[i];
+            let markup = '';
 
             if (item) {
-                slot.classList.add('has-item');
+                // One template per slot, without layout whitespace to copy, compare or parse
                 const itemWithCount = item as { name: string; stackable?: boolean; count?: number };
-                slot.innerHTML = `
-                    <div class="item-name">${item.name}</div>
-                    ${itemWithCount.stackable ? `<div class="item-count">${itemWithCount.count || 1}</div>` : ''}
-                `;
-            } else {
-                slot.classList.remove('has-item');
-                slot.innerHTML = '';
+                const count = itemWithCount.stackable ? `<div class="item-count">${itemWithCount.count || 1}</div>` : '';
+                markup = `<div class="item-name">${item.name}</div>${count}`;
             }
+
+            if (this.slotMarkup[i] === markup) continue;
+            this.slotMarkup[i] = markup;
+
+            slot.classList.toggle('has-item', !!item);
+            slot.innerHTML = markup;
         }
 
         // Update count
         const countSpan = document.getElementById('inventory-count');
         if (countSpan) {
-            countSpan.textContent = this.player.getInventoryCount().toString();
+            this.setText(countSpan, this.player.getInventoryCount().toString());
         }
     }
 
@@ -405,6 +548,8 @@ export class UIManager {
 
     /**
      * Update equipment display
+     * Slots remember the item they last showed and are only rewritten when
+     * it changed
      */
     updateEquipment(): void {
         const equipmentSlots = document.querySelectorAll('.equipment-slot');
@@ -416,6 +561,10 @@ export class UIManager {
             const item = this.player.equipment[slot];
             const htmlEl = slotEl as HTMLElement;
 
+            const shown = item ? item.name : '';
+            if (this.equippedNames.get(htmlEl) === shown) return;
+            this.equippedNames.set(htmlEl, shown);
+
             if (item) {
                 htmlEl.classList.add('has-item');
                 htmlEl.innerHTML = `<div class="equip-item-name">${item.name}</div>`;
@@ -432,9 +581,9 @@ export class UIManager {
         const defenceBonus = document.getElementById('defence-bonus');
         const strengthBonus = document.getElementById('strength-bonus');
 
-        if (attackBonus) attackBonus.textContent = this.player.equipmentBonuses.attack.toString();
-        if (defenceBonus) defenceBonus.textContent = this.player.equipmentBonuses.defence.toString();
-        if (strengthBonus) strengthBonus.textContent = this.player.equipmentBonuses.strength.toString();
+        if (attackBonus) this.setText(attackBonus, this.player.equipmentBonuses.attack.toString());
+        if (defenceBonus) this.setText(defenceBonus, this.player.equipmentBonuses.defence.toString());
+        if (strengthBonus) this.setText(strengthBonus, this.player.equipmentBonuses.strength.toString());
     }
 
     /**
@@ -664,47 +813,92 @@ export class UIManager {
         }
     }
 
+    /**
+     * Get the minimap canvas context and its scale, resolved once and cached
+     */
+    private getMinimap(): MinimapView | null {
+        if (!this.minimap) {
+            const canvas = document.getElementById('minimap-canvas') as HTMLCanvasElement | null;
+            if (!canvas) return null;
+
+            const ctx = canvas.getContext('2d');
+            if (!ctx) return null;
+
+            this.minimap = {
+                ctx,
+                width: canvas.width,
+                height: canvas.height,
+                scale: canvas.width / 200, // 200 units of game world
+                centerX: canvas.width / 2,
+                centerY: canvas.height / 2,
+                markers: new Int16Array(0),
+                drawn: new Int16Array(0),
+                drawnLength: -1
+            };
+        }
+        return this.minimap;
+    }
+
     /**
      * Update minimap
      */
     updateMinimap(player: Player, npcs: NPC[], enemies: Enemy[]): void {
-        const canvas = document.getElementById('minimap-canvas') as HTMLCanvasElement | null;
-        if (!canvas) return;
-
-        const ctx = canvas.getContext('2d');
-        if (!ctx) return;
+        const minimap = this.getMinimap();
+        if (!minimap) return;
+
+        const { ctx, width, height, scale, centerX, centerY } = minimap;
+        const px = player.position.x;
+        const pz = player.position.z;
+
+        // Project every marker to whole pixels: [riverX, npcCount, x0, y0, x1, y1, ...]
+        // The Int16Array truncates on store, so no explicit rounding is needed
+        const capacity = 2 + (npcs.length + enemies.length) * 2;
+        if (minimap.markers.length < capacity) {
+            minimap.markers = new Int16Array(capacity);
+            minimap.drawn = new Int16Array(capacity);
+            minimap.drawnLength = -1;
+        }
+        const markers = minimap.markers;
+        let length = 0;
+
+        markers[length++] = centerX + (20 - px) * scale;
+        markers[length++] = npcs.length;
+        for (const npc of npcs) {
+            markers[length++] = centerX + (npc.position.x - px) * scale;
+            markers[length++] = centerY + (npc.position.z - pz) * scale;
+        }
+        for (const enemy of enemies) {
+            if (enemy.isDead) continue;
+            markers[length++] = centerX + (enemy.position.x - px) * scale;
+            markers[length++] = centerY + (enemy.position.z - pz) * scale;
+        }
 
-        const width = canvas.width;
-        const height = canvas.height;
+        // Nothing moved by a whole pixel since the last repaint: keep the canvas as is
+        if (length === minimap.drawnLength) {
+            let changed = false;
+            for (let i = 0; i < length; i++) {
+                if (markers[i] !== minimap.drawn[i]) {
+                    changed = true;
+                    break;
+                }
+            }
+            if (!changed) return;
+        }
+        minimap.drawn.set(markers.subarray(0, length));
+        minimap.drawnLength = length;
 
         // Clear
         ctx.fillStyle = '#1a1a1a';
         ctx.fillRect(0, 0, width, height);
 
-        const scale = width / 200; // 200 units of game world
-        const centerX = width / 2;
-        const centerY = height / 2;
-
         // Draw terrain features
         ctx.fillStyle = '#4682B4';
-        ctx.fillRect(centerX + (20 - player.position.x) * scale - 3, 0, 6, height);
+        ctx.fillRect(markers[0] - 3, 0, 6, height);
 
-        // Draw NPCs
-        ctx.fillStyle = '#FFFF00';
-        for (const npc of npcs) {
-            const dx = (npc.position.x - player.position.x) * scale;
-            const dy = (npc.position.z - player.position.z) * scale;
-            ctx.fillRect(centerX + dx - 1, centerY + dy - 1, 2, 2);
-        }
-
-        // Draw enemies
-        ctx.fillStyle = '#FF0000';
-        for (const enemy of enemies) {
-            if (enemy.isDead) continue;
-            const dx = (enemy.position.x - player.position.x) * scale;
-            const dy = (enemy.position.z - player.position.z) * scale;
-            ctx.fillRect(centerX + dx - 1, centerY + dy - 1, 2, 2);
-        }
+        // Draw NPCs, then enemies: each color is one path filled once
+        const npcEnd = 2 + markers[1] * 2;
+        this.fillMarkers(ctx, markers, 2, npcEnd, '#FFFF00');
+        this.fillMarkers(ctx, markers, npcEnd, length, '#FF0000');
 
         // Draw player
         ctx.fillStyle = '#0099FF';
@@ -713,6 +907,26 @@ export class UIManager {
         ctx.fill();
     }
 
+    /**
+     * Fill 2x2 dots for the marker pairs in [start, end) as a single path
+     */
+    private fillMarkers(
+        ctx: CanvasRenderingContext2D,
+        markers: Int16Array,
+        start: number,
+        end: number,
+        color: string
+    ): void {
+        if (start >= end) return;
+
+        ctx.fillStyle = color;
+        ctx.beginPath();
+        for (let i = start; i < end; i += 2) {
+            ctx.rect(markers[i] - 1, markers[i + 1] - 1, 2, 2);
+        }
+        ctx.fill();
+    }
+
     /**
      * Show level up notification
      */
@@ -775,6 +989,11 @@ export class UIManager {
         // Clear current tab reference
         this.currentTab = '';
         this.onInventoryTabOpen = null;
+        this.minimap = null;
+        this.statsElements = null;
+        this.slotMarkup = [];
+        this.equippedNames = new WeakMap();
+        this.statsSnapshot = null;
 
         // Note: Event listeners on DOM elements (tab buttons, chat input, inventory slots, context menus)
         // would need to be explicitly removed if handler references were stored during setupEventListeners()
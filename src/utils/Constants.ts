@@ -10,12 +10,20 @@ import type { OSRSItem, CameraSettings, GameColors, SkillName, EquipmentSlot } f
 export const WORLD_SIZE: number = 300;
 export const TILE_SIZE: number = 2;
 
+/** Half-width of the walkable square centred on the origin */
+export const WORLD_BOUND: number = 140;
+
 // ============ MOVEMENT SPEEDS ============
 
 export const PLAYER_SPEED: number = 10;
 export const NPC_SPEED: number = 3;
 export const ENEMY_SPEED: number = 5;
 
+// ============ SIMULATION ============
+
+/** Entities farther than this from the player are not simulated (beyond max camera view) */
+export const AI_ACTIVATION_RADIUS: number = 100;
+
 // ============ COMBAT CONSTANTS ============
 
 export const COMBAT_RANGE: number = 5;
@@ -321,9 +329,11 @@ export const CAMERA: CameraSettings = {
 export default {
     WORLD_SIZE,
     TILE_SIZE,
+    WORLD_BOUND,
     PLAYER_SPEED,
     NPC_SPEED,
     ENEMY_SPEED,
+    AI_ACTIVATION_RADIUS,
     COMBAT_RANGE,
     ATTACK_COOLDOWN,
     MAX_HIT,
@@ -0,0 +1,58 @@
+/**
+ * MovementKeys - Keyboard codes that steer the player
+ * Input classes resolve the held keys into a direction once per key event,
+ * so per-frame movement reads two numbers instead of looking up eight keys
+ */
+
+/**
+ * Direction bits (a direction counts once however many of its keys are held)
+ */
+const UP = 1;
+const DOWN = 2;
+const LEFT = 4;
+const RIGHT = 8;
+
+/**
+ * Movement key code -> direction bit
+ */
+const MOVEMENT_KEYS: ReadonlyMap<string, number> = new Map([
+    ['KeyW', UP],
+    ['ArrowUp', UP],
+    ['KeyS', DOWN],
+    ['ArrowDown', DOWN],
+    ['KeyA', LEFT],
+    ['ArrowLeft', LEFT],
+    ['KeyD', RIGHT],
+    ['ArrowRight', RIGHT]
+]);
+
+/**
+ * Unnormalized ground-plane movement direction (each axis -1, 0 or 1)
+ */
+export interface MoveDirection {
+    x: number;
+    z: number;
+}
+
+/**
+ * Check whether a key code steers the player
+ */
+export function isMovementKey(code: string): boolean {
+    return MOVEMENT_KEYS.has(code);
+}
+
+/**
+ * Resolve the held movement keys into a direction
+ * @param keys - Key code -> held state
+ * @param out - Direction to write into
+ * @returns The out direction
+ */
+export function resolveMoveDirection(keys: Record<string, boolean>, out: MoveDirection): MoveDirection {
+    let held = 0;
+    for (const [code, bit] of MOVEMENT_KEYS) {
+        if (keys[code]) held |= bit;
+    }
+    out.x = (held & RIGHT ? 1 : 0) - (held & LEFT ? 1 : 0);
+    out.z = (held & DOWN ? 1 : 0) - (held & UP ? 1 : 0);
+    return out;
+}
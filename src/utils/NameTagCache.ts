@@ -0,0 +1,94 @@
+/**
+ * NameTagCache - Shared name tag textures for entity sprites
+ * Renders each distinct label once and reuses the material across entities
+ */
+
+import * as THREE from 'three';
+
+/**
+ * NameTagCache class - Caches rendered name tag materials by label, color and font
+ */
+export class NameTagCache {
+    /** Name tag canvas width in pixels */
+    static readonly WIDTH: number = 256;
+
+    /** Name tag canvas height in pixels */
+    static readonly HEIGHT: number = 64;
+
+    private static materials: Map<string, THREE.SpriteMaterial> = new Map();
+
+    /**
+     * Get the sprite material for a name tag, rendering it on first use
+     * @param text - Label text
+     * @param color - CSS fill color
+     * @param font - CSS font string
+     * @returns Shared sprite material, or null if a 2D context is unavailable
+     */
+    static getMaterial(text: string, color: string, font: string): THREE.SpriteMaterial | null {
+        const key = `${text}|${color}|${font}`;
+        const cached = this.materials.get(key);
+        if (cached) return cached;
+
+        const canvas = document.createElement('canvas');
+        const context = canvas.getContext('2d');
+        if (!context) return null;
+
+        canvas.width = this.WIDTH;
+        canvas.height = this.HEIGHT;
+        context.fillStyle = color;
+        context.font = font;
+        context.textAlign = 'center';
+        context.fillText(text, this.WIDTH / 2, 40);
+
+        // Blended so the antialiased text edges stay smooth
+        const texture = NameTagCache.createTexture(canvas);
+        const material = new THREE.SpriteMaterial({
+            map: texture,
+            transparent: true
+        });
+        this.materials.set(key, material);
+        return material;
+    }
+
+    /**
+     * Wrap a 2D canvas in a texture configured for the renderer's sRGB output.
+     * Labels are only ever drawn near their native size, so mipmap generation
+     * is skipped to keep the upload to a single level.
+     */
+    static createTexture(canvas: HTMLCanvasElement): THREE.CanvasTexture {
+        const texture = new THREE.CanvasTexture(canvas);
+        texture.colorSpace = THREE.SRGBColorSpace;
+        texture.generateMipmaps = false;
+        texture.minFilter = THREE.LinearFilter;
+        return texture;
+    }
+
+    /**
+     * Create a name tag sprite using the shared material
+     * @returns Sprite, or null if a 2D context is unavailable
+     */
+    static createSprite(text: string, color: string, font: string): THREE.Sprite | null {
+        const material = this.getMaterial(text, color, font);
+        return material ? new THREE.Sprite(material) : null;
+    }
+
+    /**
+     * Number of distinct name tags currently cached
+     */
+    static size(): number {
+        return this.materials.size;
+    }
+
+    /**
+     * Dispose all cached textures and materials
+     */
+    static clear(): void {
+        for (const material of this.materials.values()) {
+            material.map?.dispose();
+            material.dispose();
+        }
+        this.materials.clear();
+    }
+}
+
+export default NameTagCache;
@@ -0,0 +1,52 @@
+/**
+ * RandomTable - Precomputed uniform random values for entity AI
+ * Wander logic draws from one shared table instead of calling Math.random
+ * for every angle, distance and cooldown roll
+ */
+
+/**
+ * RandomTable class - Cycles through a fixed table of values in [0, 1)
+ */
+export class RandomTable {
+    /** Number of precomputed values (power of two so the index can be masked) */
+    static readonly SIZE: number = 4096;
+
+    private static values: Float64Array = RandomTable.fill(new Float64Array(RandomTable.SIZE));
+    private static index: number = 0;
+
+    /**
+     * Fill a table with fresh Math.random values
+     */
+    private static fill(table: Float64Array): Float64Array {
+        for (let i = 0; i < table.length; i++) {
+            table[i] = Math.random();
+        }
+        return table;
+    }
+
+    /**
+     * Get the next value in [0, 1)
+     */
+    static next(): number {
+        const value = this.values[this.index];
+        this.index = (this.index + 1) & (this.SIZE - 1);
+        return value;
+    }
+
+    /**
+     * Get the next value in [min, max)
+     */
+    static range(min: number, max: number): number {
+        return min + this.next() * (max - min);
+    }
+
+    /**
+     * Refill the table with new values and restart from the beginning
+     */
+    static reseed(): void {
+        this.fill(this.values);
+        this.index = 0;
+    }
+}
+
+export default RandomTable;
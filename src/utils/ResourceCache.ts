@@ -0,0 +1,38 @@
+/**
+ * ResourceCache - Keyed get-or-create caches for shared GPU resources
+ * Geometry and materials shared between instances live in module-level
+ * maps; these helpers fill them lazily and release them on teardown
+ */
+
+/**
+ * Anything holding resources released by dispose() (geometry, materials, textures)
+ */
+export interface Disposable {
+    dispose(): void;
+}
+
+/**
+ * Get a cached value, creating and storing it on first use
+ * @param cache - Map to look the key up in
+ * @param key - Cache key
+ * @param create - Builds the value when the key is missing (the value type
+ * comes from the cache, so a factory returning a subtype still fits)
+ */
+export function getOrCreate<K, V>(cache: Map<K, V>, key: K, create: () => NoInfer<V>): V {
+    let value = cache.get(key);
+    if (value === undefined) {
+        value = create();
+        cache.set(key, value);
+    }
+    return value;
+}
+
+/**
+ * Dispose every cached value and empty the cache
+ */
+export function disposeAll(cache: Map<unknown, Disposable>): void {
+    for (const value of cache.values()) {
+        value.dispose();
+    }
+    cache.clear();
+}
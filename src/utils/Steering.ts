@@ -0,0 +1,83 @@
+/**
+ * Steering - Shared wander and move-to-target math for NPCs and enemies
+ * Operates on the XZ plane and writes into caller-owned vectors
+ */
+
+import * as THREE from 'three';
+import { RandomTable } from './RandomTable';
+
+/**
+ * Number of precomputed wander directions (power of two)
+ */
+const DIRECTION_STEPS = 1024;
+
+/**
+ * Unit-circle lookup tables for wander directions
+ */
+const DIRECTION_COS = new Float64Array(DIRECTION_STEPS);
+const DIRECTION_SIN = new Float64Array(DIRECTION_STEPS);
+for (let i = 0; i < DIRECTION_STEPS; i++) {
+    const angle = (i / DIRECTION_STEPS) * Math.PI * 2;
+    DIRECTION_COS[i] = Math.cos(angle);
+    DIRECTION_SIN[i] = Math.sin(angle);
+}
+
+/**
+ * Any object with ground-plane coordinates
+ */
+export interface GroundPoint {
+    x: number;
+    z: number;
+}
+
+/**
+ * Steering class - Stateless wander/steering helpers
+ */
+export class Steering {
+    /**
+     * Pick a random point within a radius of an origin
+     * @param origin - Centre of the wander area
+     * @param radius - Maximum distance from the origin
+     * @param out - Vector to write the target into
+     * @returns The out vector
+     */
+    static pickWanderTarget(origin: GroundPoint, radius: number, out: THREE.Vector3): THREE.Vector3 {
+        const direction = (RandomTable.next() * DIRECTION_STEPS) & (DIRECTION_STEPS - 1);
+        const distance = RandomTable.next() * radius;
+        return out.set(
+            origin.x + DIRECTION_COS[direction] * distance,
+            0,
+            origin.z + DIRECTION_SIN[direction] * distance
+        );
+    }
+
+    /**
+     * Move a position towards a target by up to stepLength
+     * @param position - Position to move (modified in place)
+     * @param target - Point to move towards
+     * @param stepLength - Distance to travel this frame
+     * @param arriveDistance - Distance at which the target counts as reached
+     * @returns Heading (Y rotation) to face while moving, or null if already arrived
+     */
+    static stepTowards(
+        position: THREE.Vector3,
+        target: GroundPoint,
+        stepLength: number,
+        arriveDistance: number
+    ): number | null {
+        const dx = target.x - position.x;
+        const dz = target.z - position.z;
+        const distance = Math.sqrt(dx * dx + dz * dz);
+
+        if (distance < arriveDistance) {
+            return null;
+        }
+
+        const step = stepLength / distance;
+        position.x += dx * step;
+        position.z += dz * step;
+        return Math.atan2(dx, dz);
+    }
+}
+
+export default Steering;
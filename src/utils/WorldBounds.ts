@@ -0,0 +1,12 @@
+/**
+ * WorldBounds - The walkable square centred on the origin
+ */
+
+import { WORLD_BOUND } from './Constants';
+
+/**
+ * Check whether a ground-plane point lies strictly inside the world bounds
+ */
+export function inWorldBounds(x: number, z: number): boolean {
+    return Math.abs(x) < WORLD_BOUND && Math.abs(z) < WORLD_BOUND;
+}
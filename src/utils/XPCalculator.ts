@@ -30,16 +30,23 @@ export class XPCalculator {
 
     /**
      * Get level from XP
+     * Binary search over the XP table: the lowest level whose next-level
+     * threshold is above xp
      * @param xp - Current experience points
      * @returns Level corresponding to the XP amount (1-99)
      */
     static getLevelFromXP(xp: number): number {
-        for (let level = 1; level <= 99; level++) {
-            if (xp < XP_TABLE[level]) {
-                return level;
+        let low = 1;
+        let high = 99;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (xp < XP_TABLE[mid]) {
+                high = mid;
+            } else {
+                low = mid + 1;
             }
         }
-        return 99;
+        return low;
     }
 
     /**
@@ -0,0 +1,188 @@
+/**
+ * EntityPositions - Struct-of-arrays ground positions for a fixed entity list
+ * Index i always refers to entities[i] of the list it was built from
+ * Indices are also bucketed into a uniform grid so radius queries only
+ * visit the cells the circle overlaps
+ */
+
+/**
+ * Grid cell edge length in world units
+ */
+const CELL_SIZE = 64;
+
+/**
+ * Offset keeping cell coordinates non-negative when packed into one key
+ */
+const CELL_OFFSET = 32768;
+
+/**
+ * Pack a cell coordinate pair into a single map key
+ */
+function cellKey(cx: number, cz: number): number {
+    return (cx + CELL_OFFSET) * 65536 + (cz + CELL_OFFSET);
+}
+
+/**
+ * Anything with a ground-plane position
+ */
+interface Positioned {
+    position: { x: number; z: number };
+}
+
+/**
+ * Plane as normal . p + constant = 0 (e.g. a THREE.Plane)
+ */
+interface PlaneLike {
+    normal: { x: number; z: number };
+    constant: number;
+}
+
+/**
+ * EntityPositions class - Packed X/Z columns for bulk distance queries
+ */
+export class EntityPositions {
+    /** X coordinate per entity */
+    readonly x: Float32Array;
+
+    /** Z coordinate per entity */
+    readonly z: Float32Array;
+
+    /** Number of entities tracked */
+    readonly count: number;
+
+    /** Per-entity result of the last withinRadius query (1 = inside) */
+    readonly inRange: Uint8Array;
+
+    /** Per-entity result of the last withinFrustum query (1 = visible) */
+    readonly inView: Uint8Array;
+
+    /** Grid cell key per entity */
+    private readonly cells: Float64Array;
+
+    /** Entity indices per occupied grid cell */
+    private readonly buckets: Map<number, number[]>;
+
+    constructor(count: number) {
+        this.count = count;
+        this.x = new Float32Array(count);
+        this.z = new Float32Array(count);
+        this.inRange = new Uint8Array(count);
+        this.inView = new Uint8Array(count);
+
+        // Everything starts at the origin cell
+        const origin = cellKey(0, 0);
+        this.cells = new Float64Array(count).fill(origin);
+        this.buckets = new Map();
+        if (count > 0) {
+            this.buckets.set(origin, Array.from({ length: count }, (_, i) => i));
+        }
+    }
+
+    /**
+     * Build columns for an entity list and copy in their current positions
+     */
+    static from(entities: readonly Positioned[]): EntityPositions {
+        const positions = new EntityPositions(entities.length);
+        for (let i = 0; i < entities.length; i++) {
+            positions.set(i, entities[i].position.x, entities[i].position.z);
+        }
+        return positions;
+    }
+
+    /**
+     * Store the position of entity i
+     */
+    set(i: number, x: number, z: number): void {
+        this.x[i] = x;
+        this.z[i] = z;
+
+        const key = cellKey(Math.floor(this.x[i] / CELL_SIZE), Math.floor(this.z[i] / CELL_SIZE));
+        const previous = this.cells[i];
+        if (key === previous) return;
+
+        // Crossed into another cell: move the index between buckets
+        const oldBucket = this.buckets.get(previous)!;
+        const slot = oldBucket.indexOf(i);
+        oldBucket[slot] = oldBucket[oldBucket.length - 1];
+        oldBucket.pop();
+        if (oldBucket.length === 0) {
+            this.buckets.delete(previous);
+        }
+
+        const bucket = this.buckets.get(key);
+        if (bucket) {
+            bucket.push(i);
+        } else {
+            this.buckets.set(key, [i]);
+        }
+        this.cells[i] = key;
+    }
+
+    /**
+     * Squared ground distance from entity i to a point
+     */
+    distanceSq(i: number, x: number, z: number): number {
+        const dx = this.x[i] - x;
+        const dz = this.z[i] - z;
+        return dx * dx + dz * dz;
+    }
+
+    /**
+     * Mark every entity inside a circle, testing only the grid cells it overlaps
+     * Results are written to inRange
+     * @returns The inRange mask
+     */
+    withinRadius(x: number, z: number, radius: number): Uint8Array {
+        const xs = this.x;
+        const zs = this.z;
+        const inRange = this.inRange;
+        const radiusSq = radius * radius;
+        inRange.fill(0);
+
+        const minCX = Math.floor((x - radius) / CELL_SIZE);
+        const maxCX = Math.floor((x + radius) / CELL_SIZE);
+        const minCZ = Math.floor((z - radius) / CELL_SIZE);
+        const maxCZ = Math.floor((z + radius) / CELL_SIZE);
+        for (let cx = minCX; cx <= maxCX; cx++) {
+            for (let cz = minCZ; cz <= maxCZ; cz++) {
+                const bucket = this.buckets.get(cellKey(cx, cz));
+                if (!bucket) continue;
+                for (const i of bucket) {
+                    const dx = xs[i] - x;
+                    const dz = zs[i] - z;
+                    if (dx * dx + dz * dz <= radiusSq) {
+                        inRange[i] = 1;
+                    }
+                }
+            }
+        }
+        return inRange;
+    }
+
+    /**
+     * Mark every entity whose ground-level bounding sphere touches all planes'
+     * inner sides (a camera frustum), one plane at a time over the columns
+     * Results are written to inView
+     * @returns The inView mask
+     */
+    withinFrustum(planes: readonly PlaneLike[], radius: number): Uint8Array {
+        const xs = this.x;
+        const zs = this.z;
+        const inView = this.inView;
+        inView.fill(1);
+
+        for (const plane of planes) {
+            const nx = plane.normal.x;
+            const nz = plane.normal.z;
+            const offset = plane.constant + radius;
+            for (let i = 0; i < this.count; i++) {
+                if (nx * xs[i] + nz * zs[i] + offset < 0) {
+                    inView[i] = 0;
+                }
+            }
+        }
+        return inView;
+    }
+}
+
+export default EntityPositions;
@@ -4,9 +4,12 @@
  */
 
 import * as THREE from 'three';
-import { WORLD_SIZE, TILE_SIZE, COLORS, BUILDINGS, NPC_TYPES, ENEMY_TYPES } from '../utils/Constants';
+import { mergeGeometries } from 'three/examples/jsm/utils/BufferGeometryUtils.js';
+import { WORLD_SIZE, TILE_SIZE, COLORS, BUILDINGS, NPC_TYPES, ENEMY_TYPES, AI_ACTIVATION_RADIUS } from '../utils/Constants';
 import { NPC } from '../entities/NPC';
 import { Enemy } from '../entities/Enemy';
+import { EntityPositions } from './EntityPositions';
+import { getOrCreate, disposeAll } from '../utils/ResourceCache';
 import { NPC_DATA } from '../data/NPCData';
 import { ENEMY_DATA, SPAWN_LOCATIONS } from '../data/EnemyData';
 import type { Player } from '../entities/Player';
@@ -29,6 +32,29 @@ interface Resource {
     respawn(): void;
 }
 
+/**
+ * Entity cull sphere radius, padded to cover name tags and HP bars above
+ * the entity origin
+ */
+const CULL_RADIUS = 4;
+
+/**
+ * Extra cull padding for the shadows entities cast into view from just
+ * off-screen: the sun sits at (50, 100, 50), so a shadow runs about 0.71x
+ * the height of its caster (entities top out around 2.5 units)
+ */
+const SHADOW_REACH = 2;
+
+/**
+ * Edge length in texels of the baked grass tile
+ */
+const GRASS_TILE_SIZE = 32;
+
+/**
+ * World units covered by one repeat of the grass tile
+ */
+const GRASS_TILE_WORLD = 8;
+
 /**
  * NPC spawn position interface
  */
@@ -37,6 +63,49 @@ interface NPCSpawn {
     z: number;
 }
 
+/**
+ * Generic building placement interface
+ */
+interface GenericBuildingSpawn {
+    x: number;
+    z: number;
+    roofColor: number;
+}
+
+/**
+ * Shared building geometries and materials, keyed by part name.
+ * Buildings (and repeated props such as trees and rocks) of the same type
+ * reuse one GPU buffer/program instead of allocating fresh geometry and
+ * materials for every instance.
+ */
+const BUILDING_GEOMETRIES: Map<string, THREE.BufferGeometry> = new Map();
+const BUILDING_MATERIALS: Map<string, THREE.Material> = new Map();
+
+/**
+ * Give every vertex of a geometry the same color attribute
+ */
+function paintGeometry(geometry: THREE.BufferGeometry, hex: number): THREE.BufferGeometry {
+    const color = new THREE.Color(hex);
+    const count = geometry.attributes.position.count;
+    const colors = new Float32Array(count * 3);
+    for (let i = 0; i < count; i++) {
+        colors[i * 3] = color.r;
+        colors[i * 3 + 1] = color.g;
+        colors[i * 3 + 2] = color.b;
+    }
+    geometry.setAttribute('color', new THREE.BufferAttribute(colors, 3));
+    return geometry;
+}
+
+/**
+ * Raycast hook for entity roots: three.js does not descend into an object
+ * whose raycast returns false, so click picks skip hidden entities (off-screen
+ * or dead) without testing any of their parts
+ */
+function skipHiddenSubtree(this: THREE.Object3D): false | undefined {
+    return this.visible ? undefined : false;
+}
+
 /**
  * Lumbridge class - Creates the game world
  */
@@ -48,13 +117,41 @@ export class Lumbridge {
     public enemies: Enemy[];
     private resources: Resource[];
 
+    // Merged building geometries owned by this world (not in the shared cache)
+    private mergedGeometries: THREE.BufferGeometry[];
+
+    // Packed positions, indexed like npcs/enemies (which never reorder)
+    private npcPositions: EntityPositions;
+    private enemyPositions: EntityPositions;
+
+    // Half-rate AI scheduling: which index parity updates this frame, the
+    // world clock, and when each entity's AI last stepped (indexed like npcs/enemies)
+    private aiParity: number;
+    private aiClock: number;
+    private npcSteppedAt: Float64Array;
+    private enemySteppedAt: Float64Array;
+
+    // View culling (reused every frame to avoid allocations)
+    private frustum: THREE.Frustum;
+    private viewProjection: THREE.Matrix4;
+
     constructor(engine: GameEngine) {
         this.engine = engine;
         this.terrain = null;
         this.buildings = [];
+        this.mergedGeometries = [];
         this.npcs = [];
         this.enemies = [];
         this.resources = [];
+        this.npcPositions = new EntityPositions(0);
+        this.enemyPositions = new EntityPositions(0);
+        this.aiParity = 0;
+        this.aiClock = 0;
+        this.npcSteppedAt = new Float64Array(0);
+        this.enemySteppedAt = new Float64Array(0);
+
+        this.frustum = new THREE.Frustum();
+        this.viewProjection = new THREE.Matrix4();
     }
 
     /**
@@ -72,32 +169,55 @@ export class Lumbridge {
 
     /**
      * Create terrain (grass ground)
+     * The ground is a single quad; grass variation comes from a small shade
+     * tile baked once and repeated across it
      */
     createTerrain(): void {
-        const geometry = new THREE.PlaneGeometry(WORLD_SIZE, WORLD_SIZE, 100, 100);
+        const geometry = new THREE.PlaneGeometry(WORLD_SIZE, WORLD_SIZE);
         const material = new THREE.MeshStandardMaterial({
             color: COLORS.GRASS,
+            map: this.createGrassTexture(),
             side: THREE.DoubleSide,
             roughness: 0.9,
             metalness: 0.0
         });
 
-        // Add some variation to terrain height
-        const positions = geometry.attributes.position;
-        for (let i = 0; i < positions.count; i++) {
-            const y = Math.random() * 0.5;
-            positions.setY(i, y);
-        }
-        geometry.computeVertexNormals();
-
         this.terrain = new THREE.Mesh(geometry, material);
         this.terrain.rotation.x = -Math.PI / 2;
         this.terrain.receiveShadow = true;
         this.terrain.userData.type = 'terrain';
+        this.freezeStatic(this.terrain);
 
         this.engine.scene!.add(this.terrain);
     }
 
+    /**
+     * Bake a tileable grass shade texture (multiplies the grass color)
+     * Shades are sRGB-encoded; 236-255 spans roughly 84-100% brightness.
+     * The tile repeats dozens of times, so it is mipmapped against shimmer.
+     */
+    private createGrassTexture(): THREE.DataTexture {
+        const data = new Uint8Array(GRASS_TILE_SIZE * GRASS_TILE_SIZE * 4);
+        for (let i = 0; i < data.length; i += 4) {
+            const shade = 236 + Math.floor(Math.random() * 20);
+            data[i] = shade;
+            data[i + 1] = shade;
+            data[i + 2] = shade;
+            data[i + 3] = 255;
+        }
+
+        const texture = new THREE.DataTexture(data, GRASS_TILE_SIZE, GRASS_TILE_SIZE);
+        texture.wrapS = THREE.RepeatWrapping;
+        texture.wrapT = THREE.RepeatWrapping;
+        texture.repeat.set(WORLD_SIZE / GRASS_TILE_WORLD, WORLD_SIZE / GRASS_TILE_WORLD);
+        texture.colorSpace = THREE.SRGBColorSpace;
+        texture.magFilter = THREE.LinearFilter;
+        texture.minFilter = THREE.LinearMipmapLinearFilter;
+        texture.generateMipmaps = true;
+        texture.needsUpdate = true;
+        return texture;
+    }
+
     /**
      * Create River Lum
      */
@@ -115,6 +235,7 @@ export class Lumbridge {
         river.rotation.x = -Math.PI / 2;
         river.position.set(20, 0.1, 0);
         river.userData.type = 'river';
+        this.freezeStatic(river);
 
         this.engine.scene!.add(river);
 
@@ -160,9 +281,74 @@ export class Lumbridge {
         bridgeGroup.add(rightRailing);
 
         bridgeGroup.position.set(x, 0, z);
+        this.mergeRepeatedParts(bridgeGroup);
+        this.freezeStatic(bridgeGroup);
         this.engine.scene!.add(bridgeGroup);
     }
 
+    /**
+     * Bake the local transforms of a static object (and its children) once
+     * and stop three.js from recomposing them every frame
+     */
+    private freezeStatic(object: THREE.Object3D): void {
+        object.traverse((child) => {
+            child.updateMatrix();
+            child.matrixAutoUpdate = false;
+        });
+    }
+
+    /**
+     * Collapse parts of a static group that share a material into a single
+     * mesh per material, so repeated pieces (towers, windows, railings) are
+     * culled and drawn as one object. Parts whose material is used only once
+     * are left as they are. Must run before freezeStatic.
+     */
+    private mergeRepeatedParts(group: THREE.Group): void {
+        group.updateMatrixWorld(true);
+        const toGroup = new THREE.Matrix4().copy(group.matrixWorld).invert();
+
+        const byMaterial: Map<THREE.Material, THREE.Mesh[]> = new Map();
+        group.traverse((child) => {
+            const mesh = child as THREE.Mesh;
+            if (!mesh.isMesh || Array.isArray(mesh.material)) return;
+            const meshes = byMaterial.get(mesh.material);
+            if (meshes) {
+                meshes.push(mesh);
+            } else {
+                byMaterial.set(mesh.material, [mesh]);
+            }
+        });
+
+        for (const [material, meshes] of byMaterial) {
+            if (meshes.length < 2) continue;
+
+            // Bake each part's transform (relative to the group) into a copy of its geometry
+            const geometries = meshes.map((mesh) =>
+                mesh.geometry.clone().applyMatrix4(new THREE.Matrix4().multiplyMatrices(toGroup, mesh.matrixWorld))
+            );
+            const merged = mergeGeometries(geometries);
+            for (const geometry of geometries) {
+                geometry.dispose();
+            }
+            if (!merged) continue;
+
+            const combined = new THREE.Mesh(merged, material);
+            combined.castShadow = meshes.some((mesh) => mesh.castShadow);
+            combined.receiveShadow = meshes.some((mesh) => mesh.receiveShadow);
+            for (const mesh of meshes) {
+                mesh.removeFromParent();
+            }
+            group.add(combined);
+        }
+
+        // Drop sub-groups emptied by the merge (e.g. castle towers)
+        for (const child of [...group.children]) {
+            if (!(child as THREE.Mesh).isMesh && child.children.length === 0) {
+                child.removeFromParent();
+            }
+        }
+    }
+
     /**
      * Create buildings
      */
@@ -173,23 +359,25 @@ export class Lumbridge {
         // Church
         this.createChurch(-10, 25);
 
-        // General Store
-        this.createGenericBuilding(-50, 10, COLORS.ROOF_RED, 'General Store');
+        this.createGenericBuildings([
+            // General Store
+            { x: -50, z: 10, roofColor: COLORS.ROOF_RED },
 
-        // Bob's Axes
-        this.createGenericBuilding(-20, 40, COLORS.ROOF_RED, "Bob's Axes");
+            // Bob's Axes
+            { x: -20, z: 40, roofColor: COLORS.ROOF_RED },
 
-        // Houses
-        this.createGenericBuilding(-60, -20, COLORS.ROOF_RED);
-        this.createGenericBuilding(-40, -5, COLORS.ROOF_RED);
-        this.createGenericBuilding(-55, 30, COLORS.ROOF_RED);
+            // Houses
+            { x: -60, z: -20, roofColor: COLORS.ROOF_RED },
+            { x: -40, z: -5, roofColor: COLORS.ROOF_RED },
+            { x: -55, z: 30, roofColor: COLORS.ROOF_RED },
 
-        // Farm buildings
-        this.createGenericBuilding(-80, 10, COLORS.WOOD, 'Farm');
-        this.createGenericBuilding(-75, -30, COLORS.WOOD, 'Farm');
+            // Farm buildings
+            { x: -80, z: 10, roofColor: COLORS.WOOD },
+            { x: -75, z: -30, roofColor: COLORS.WOOD },
 
-        // Goblin house (east of river)
-        this.createGenericBuilding(50, 20, 0x4A4A4A, 'Goblin House');
+            // Goblin house (east of river)
+            { x: 50, z: 20, roofColor: 0x4A4A4A }
+        ]);
     }
 
     /**
@@ -224,11 +412,11 @@ export class Lumbridge {
 
         // Castle door
         const doorGeometry = new THREE.BoxGeometry(4, 7, 0.5);
-        const doorMaterial = new THREE.MeshStandardMaterial({
+        const doorMaterial = getOrCreate(BUILDING_MATERIALS, 'door', () => new THREE.MeshStandardMaterial({
             color: 0x3E2723,
             roughness: 0.8,
             metalness: 0.0
-        });
+        }));
         const door = new THREE.Mesh(doorGeometry, doorMaterial);
         door.position.set(0, 3.5, 10.2);
         door.castShadow = true;
@@ -248,6 +436,8 @@ export class Lumbridge {
         castleGroup.position.set(x, 0, z);
         castleGroup.userData.type = 'building';
         castleGroup.userData.buildingType = BUILDINGS.LUMBRIDGE_CASTLE;
+        this.mergeRepeatedParts(castleGroup);
+        this.freezeStatic(castleGroup);
 
         this.engine.scene!.add(castleGroup);
         this.buildings.push(castleGroup);
@@ -260,24 +450,24 @@ export class Lumbridge {
         const towerGroup = new THREE.Group();
 
         // Tower body
-        const bodyGeometry = new THREE.CylinderGeometry(3, 3, 25, 12);
-        const bodyMaterial = new THREE.MeshStandardMaterial({
+        const bodyGeometry = getOrCreate(BUILDING_GEOMETRIES, 'tower_body', () => new THREE.CylinderGeometry(3, 3, 25, 12));
+        const bodyMaterial = getOrCreate(BUILDING_MATERIALS, 'tower_body', () => new THREE.MeshStandardMaterial({
             color: 0x696969,
             roughness: 0.85,
             metalness: 0.0
-        });
+        }));
         const body = new THREE.Mesh(bodyGeometry, bodyMaterial);
         body.position.y = 12.5;
         body.castShadow = true;
         towerGroup.add(body);
 
         // Cone roof
-        const roofGeometry = new THREE.ConeGeometry(4, 5, 12);
-        const roofMaterial = new THREE.MeshStandardMaterial({
+        const roofGeometry = getOrCreate(BUILDING_GEOMETRIES, 'tower_roof', () => new THREE.ConeGeometry(4, 5, 12));
+        const roofMaterial = getOrCreate(BUILDING_MATERIALS, `roof_${COLORS.ROOF_RED}`, () => new THREE.MeshStandardMaterial({
             color: COLORS.ROOF_RED,
             roughness: 0.7,
             metalness: 0.0
-        });
+        }));
         const roof = new THREE.Mesh(roofGeometry, roofMaterial);
         roof.position.y = 27.5;
         roof.castShadow = true;
@@ -318,86 +508,81 @@ export class Lumbridge {
         churchGroup.add(roof);
 
         // Cross
-        const crossBeamH = new THREE.Mesh(
-            new THREE.BoxGeometry(1.5, 0.3, 0.3),
-            new THREE.MeshStandardMaterial({
-                color: 0xFFD700,
-                roughness: 0.2,
-                metalness: 0.8  // Gold is metallic
-            })
-        );
+        const crossMaterial = getOrCreate(BUILDING_MATERIALS, 'church_cross', () => new THREE.MeshStandardMaterial({
+            color: 0xFFD700,
+            roughness: 0.2,
+            metalness: 0.8  // Gold is metallic
+        }));
+        const crossBeamH = new THREE.Mesh(new THREE.BoxGeometry(1.5, 0.3, 0.3), crossMaterial);
         crossBeamH.position.y = 17;
         churchGroup.add(crossBeamH);
 
-        const crossBeamV = new THREE.Mesh(
-            new THREE.BoxGeometry(0.3, 2, 0.3),
-            new THREE.MeshStandardMaterial({
-                color: 0xFFD700,
-                roughness: 0.2,
-                metalness: 0.8  // Gold is metallic
-            })
-        );
+        const crossBeamV = new THREE.Mesh(new THREE.BoxGeometry(0.3, 2, 0.3), crossMaterial);
         crossBeamV.position.y = 16.5;
         churchGroup.add(crossBeamV);
 
         churchGroup.position.set(x, 0, z);
         churchGroup.userData.type = 'building';
         churchGroup.userData.buildingType = BUILDINGS.CHURCH;
+        this.mergeRepeatedParts(churchGroup);
+        this.freezeStatic(churchGroup);
 
         this.engine.scene!.add(churchGroup);
         this.buildings.push(churchGroup);
     }
 
     /**
-     * Create generic building
+     * Create generic buildings
+     * Body, roof and door are baked into one vertex-colored geometry per
+     * roof color, and every house is merged into a single mesh (one draw
+     * call)
      */
-    createGenericBuilding(x: number, z: number, roofColor: number, name: string = 'Building'): void {
-        const buildingGroup = new THREE.Group();
+    createGenericBuildings(spawns: readonly GenericBuildingSpawn[]): void {
+        if (spawns.length === 0) return;
 
-        // Body
-        const bodyGeometry = new THREE.BoxGeometry(8, 7, 6);
-        const bodyMaterial = new THREE.MeshStandardMaterial({
-            color: 0xD2B48C,
-            roughness: 0.8,
-            metalness: 0.0
-        });
-        const body = new THREE.Mesh(bodyGeometry, bodyMaterial);
-        body.position.y = 3.5;
-        body.castShadow = true;
-        buildingGroup.add(body);
-
-        // Roof
-        const roofGeometry = new THREE.ConeGeometry(6, 4, 4);
-        const roofMaterial = new THREE.MeshStandardMaterial({
-            color: roofColor,
-            roughness: 0.7,
-            metalness: 0.0
+        const placed = spawns.map((spawn) => {
+            const template = getOrCreate(BUILDING_GEOMETRIES, `generic_${spawn.roofColor}`, () => this.bakeGenericBuilding(spawn.roofColor));
+            return template.clone().translate(spawn.x, 0, spawn.z);
         });
-        const roof = new THREE.Mesh(roofGeometry, roofMaterial);
-        roof.position.y = 9;
-        roof.rotation.y = Math.PI / 4;
-        roof.castShadow = true;
-        buildingGroup.add(roof);
+        const geometry = mergeGeometries(placed)!;
+        for (const part of placed) {
+            part.dispose();
+        }
+        this.mergedGeometries.push(geometry);
 
-        // Door
-        const doorGeometry = new THREE.BoxGeometry(2, 4, 0.3);
-        const doorMaterial = new THREE.MeshStandardMaterial({
-            color: 0x3E2723,
+        const material = getOrCreate(BUILDING_MATERIALS, 'generic_building', () => new THREE.MeshStandardMaterial({
+            vertexColors: true,
             roughness: 0.8,
             metalness: 0.0
-        });
-        const door = new THREE.Mesh(doorGeometry, doorMaterial);
-        door.position.set(0, 2, 3.1);
-        buildingGroup.add(door);
+        }));
+        const buildings = new THREE.Mesh(geometry, material);
+        buildings.castShadow = true;
 
-        buildingGroup.position.set(x, 0, z);
+        const buildingGroup = new THREE.Group();
+        buildingGroup.add(buildings);
         buildingGroup.userData.type = 'building';
-        buildingGroup.userData.buildingName = name;
+        this.freezeStatic(buildingGroup);
 
         this.engine.scene!.add(buildingGroup);
         this.buildings.push(buildingGroup);
     }
 
+    /**
+     * Bake a generic building (body, roof, door) into one geometry
+     */
+    private bakeGenericBuilding(roofColor: number): THREE.BufferGeometry {
+        const parts = [
+            paintGeometry(new THREE.BoxGeometry(8, 7, 6).translate(0, 3.5, 0), 0xD2B48C),
+            paintGeometry(new THREE.ConeGeometry(6, 4, 4).rotateY(Math.PI / 4).translate(0, 9, 0), roofColor),
+            paintGeometry(new THREE.BoxGeometry(2, 4, 0.3).translate(0, 2, 3.1), 0x3E2723)
+        ];
+        const merged = mergeGeometries(parts)!;
+        for (const part of parts) {
+            part.dispose();
+        }
+        return merged;
+    }
+
     /**
      * Create NPCs using authentic OSRS data
      */
@@ -459,9 +644,13 @@ export class Lumbridge {
         // Add NPCs to scene
         for (const npc of this.npcs) {
             if (npc.mesh) {
+                npc.mesh.raycast = skipHiddenSubtree;
                 this.engine.scene!.add(npc.mesh);
             }
         }
+
+        this.npcPositions = EntityPositions.from(this.npcs);
+        this.npcSteppedAt = new Float64Array(this.npcs.length).fill(this.aiClock);
     }
 
     /**
@@ -487,9 +676,13 @@ export class Lumbridge {
         // Add enemies to scene
         for (const enemy of this.enemies) {
             if (enemy.mesh) {
+                enemy.mesh.raycast = skipHiddenSubtree;
                 this.engine.scene!.add(enemy.mesh);
             }
         }
+
+        this.enemyPositions = EntityPositions.from(this.enemies);
+        this.enemySteppedAt = new Float64Array(this.enemies.length).fill(this.aiClock);
     }
 
     /**
@@ -531,24 +724,24 @@ export class Lumbridge {
         const treeGroup = new THREE.Group();
 
         // Trunk
-        const trunkGeometry = new THREE.CylinderGeometry(0.5, 0.7, 4, 8);
-        const trunkMaterial = new THREE.MeshStandardMaterial({
+        const trunkGeometry = getOrCreate(BUILDING_GEOMETRIES, 'tree_trunk', () => new THREE.CylinderGeometry(0.5, 0.7, 4, 8));
+        const trunkMaterial = getOrCreate(BUILDING_MATERIALS, 'tree_trunk', () => new THREE.MeshStandardMaterial({
             color: 0x8B4513,
             roughness: 0.9,
             metalness: 0.0
-        });
+        }));
         const trunk = new THREE.Mesh(trunkGeometry, trunkMaterial);
         trunk.position.y = 2;
         trunk.castShadow = true;
         treeGroup.add(trunk);
 
         // Foliage
-        const foliageGeometry = new THREE.SphereGeometry(2.5, 12, 12);
-        const foliageMaterial = new THREE.MeshStandardMaterial({
+        const foliageGeometry = getOrCreate(BUILDING_GEOMETRIES, 'tree_foliage', () => new THREE.SphereGeometry(2.5, 12, 12));
+        const foliageMaterial = getOrCreate(BUILDING_MATERIALS, 'tree_foliage', () => new THREE.MeshStandardMaterial({
             color: 0x228B22,
             roughness: 0.9,
             metalness: 0.0
-        });
+        }));
         const foliage = new THREE.Mesh(foliageGeometry, foliageMaterial);
         foliage.position.y = 5;
         foliage.scale.set(1, 1.2, 1);
@@ -583,6 +776,7 @@ export class Lumbridge {
 
         treeGroup.userData.resource = resource;
 
+        this.freezeStatic(treeGroup);
         this.engine.scene!.add(treeGroup);
         this.resources.push(resource);
     }
@@ -591,12 +785,12 @@ export class Lumbridge {
      * Create rock (mining)
      */
     createRock(x: number, z: number): void {
-        const rockGeometry = new THREE.DodecahedronGeometry(1.2, 0);
-        const rockMaterial = new THREE.MeshStandardMaterial({
+        const rockGeometry = getOrCreate(BUILDING_GEOMETRIES, 'rock', () => new THREE.DodecahedronGeometry(1.2, 0));
+        const rockMaterial = getOrCreate(BUILDING_MATERIALS, 'rock', () => new THREE.MeshStandardMaterial({
             color: 0x808080,
             roughness: 0.95,
             metalness: 0.0
-        });
+        }));
         const rock = new THREE.Mesh(rockGeometry, rockMaterial);
         rock.position.set(x, 0.8, z);
         rock.castShadow = true;
@@ -627,6 +821,7 @@ export class Lumbridge {
 
         rock.userData.resource = resource;
 
+        this.freezeStatic(rock);
         this.engine.scene!.add(rock);
         this.resources.push(resource);
     }
@@ -635,12 +830,12 @@ export class Lumbridge {
      * Create fishing spot
      */
     createFishingSpot(x: number, z: number): void {
-        const geometry = new THREE.CylinderGeometry(1, 1, 0.2, 16);
-        const material = new THREE.MeshBasicMaterial({
+        const geometry = getOrCreate(BUILDING_GEOMETRIES, 'fishing_spot', () => new THREE.CylinderGeometry(1, 1, 0.2, 16));
+        const material = getOrCreate(BUILDING_MATERIALS, 'fishing_spot', () => new THREE.MeshBasicMaterial({
             color: 0x4682B4,
             transparent: true,
             opacity: 0.5
-        });
+        }));
         const spot = new THREE.Mesh(geometry, material);
         spot.position.set(x, 0.1, z);
         spot.userData.type = 'resource';
@@ -662,6 +857,7 @@ export class Lumbridge {
 
         spot.userData.resource = resource;
 
+        this.freezeStatic(spot);
         this.engine.scene!.add(spot);
         this.resources.push(resource);
     }
@@ -671,9 +867,11 @@ export class Lumbridge {
      */
     createDecorations(): void {
         // Paths (dirt paths)
-        this.createPath(-30, -30, -30, 30); // Castle to south
-        this.createPath(-30, -30, 20, -30); // Castle to bridge
-        this.createPath(-50, 10, -30, 10); // Store to castle area
+        this.createPaths([
+            [-30, -30, -30, 30], // Castle to south
+            [-30, -30, 20, -30], // Castle to bridge
+            [-50, 10, -30, 10]   // Store to castle area
+        ]);
 
         // Fences around farms
         this.createFence(-90, 0, 20, 'horizontal');
@@ -681,56 +879,80 @@ export class Lumbridge {
     }
 
     /**
-     * Create path
+     * Create dirt paths, baked into a single static mesh (one draw call)
+     * @param segments - Path segments as [x1, z1, x2, z2]
      */
-    createPath(x1: number, z1: number, x2: number, z2: number): void {
-        const length = Math.sqrt((x2 - x1) ** 2 + (z2 - z1) ** 2);
-        const geometry = new THREE.PlaneGeometry(3, length);
+    createPaths(segments: [number, number, number, number][]): void {
+        const geometries = segments.map(([x1, z1, x2, z2]) => this.createPathGeometry(x1, z1, x2, z2));
+        const merged = mergeGeometries(geometries);
+        for (const geometry of geometries) {
+            geometry.dispose();
+        }
+        if (!merged) return;
+
         const material = new THREE.MeshStandardMaterial({
             color: COLORS.DIRT,
             roughness: 0.9,
             metalness: 0.0
         });
 
-        const path = new THREE.Mesh(geometry, material);
-        path.rotation.x = -Math.PI / 2;
-        path.position.set((x1 + x2) / 2, 0.05, (z1 + z2) / 2);
+        const paths = new THREE.Mesh(merged, material);
+        paths.userData.type = 'path';
+        this.freezeStatic(paths);
+
+        this.engine.scene!.add(paths);
+    }
 
-        const angle = Math.atan2(z2 - z1, x2 - x1);
-        path.rotation.z = angle - Math.PI / 2;
+    /**
+     * Create world-space geometry for a single path segment
+     */
+    createPathGeometry(x1: number, z1: number, x2: number, z2: number): THREE.BufferGeometry {
+        const length = Math.sqrt((x2 - x1) ** 2 + (z2 - z1) ** 2);
+        const geometry = new THREE.PlaneGeometry(3, length);
 
-        this.engine.scene!.add(path);
+        // Bake the segment transform into the vertices
+        const placement = new THREE.Object3D();
+        placement.rotation.x = -Math.PI / 2;
+        placement.rotation.z = Math.atan2(z2 - z1, x2 - x1) - Math.PI / 2;
+        placement.position.set((x1 + x2) / 2, 0.05, (z1 + z2) / 2);
+        placement.updateMatrix();
+        geometry.applyMatrix4(placement.matrix);
+
+        return geometry;
     }
 
     /**
      * Create fence
+     * All posts of a fence are drawn as one instanced mesh (a single draw call)
      */
     createFence(x: number, z: number, length: number, direction: 'horizontal' | 'vertical'): void {
-        const fenceGroup = new THREE.Group();
         const postCount = Math.floor(length / 2) + 1;
 
-        for (let i = 0; i < postCount; i++) {
-            const post = new THREE.Mesh(
-                new THREE.BoxGeometry(0.2, 1.5, 0.2),
-                new THREE.MeshStandardMaterial({
-                    color: 0x654321,
-                    roughness: 0.8,
-                    metalness: 0.0
-                })
-            );
+        const postGeometry = getOrCreate(BUILDING_GEOMETRIES, 'fence_post', () => new THREE.BoxGeometry(0.2, 1.5, 0.2));
+        const postMaterial = getOrCreate(BUILDING_MATERIALS, 'fence_post', () => new THREE.MeshStandardMaterial({
+            color: 0x654321,
+            roughness: 0.8,
+            metalness: 0.0
+        }));
+
+        const posts = new THREE.InstancedMesh(postGeometry, postMaterial, postCount);
+        const postMatrix = new THREE.Matrix4();
 
+        for (let i = 0; i < postCount; i++) {
             if (direction === 'horizontal') {
-                post.position.set(i * 2, 0.75, 0);
+                postMatrix.makeTranslation(i * 2, 0.75, 0);
             } else {
-                post.position.set(0, 0.75, i * 2);
+                postMatrix.makeTranslation(0, 0.75, i * 2);
             }
-
-            post.castShadow = true;
-            fenceGroup.add(post);
+            posts.setMatrixAt(i, postMatrix);
         }
+        posts.instanceMatrix.needsUpdate = true;
+        posts.computeBoundingSphere();
+        posts.castShadow = true;
 
-        fenceGroup.position.set(x, 0, z);
-        this.engine.scene!.add(fenceGroup);
+        posts.position.set(x, 0, z);
+        this.freezeStatic(posts);
+        this.engine.scene!.add(posts);
     }
 
     /**
@@ -740,18 +962,99 @@ export class Lumbridge {
         return this.resources;
     }
 
+    /**
+     * Refresh the camera frustum from the last rendered camera state
+     * @returns false if there is no camera (treat everything as visible)
+     */
+    private updateFrustum(): boolean {
+        const camera = this.engine.camera;
+        if (!camera) return false;
+
+        this.viewProjection.multiplyMatrices(camera.projectionMatrix, camera.matrixWorldInverse);
+        this.frustum.setFromProjectionMatrix(this.viewProjection);
+        return true;
+    }
+
+    /**
+     * Hide NPCs and living enemies outside the camera view, so the renderer
+     * rejects each with one visibility check instead of frustum-testing every
+     * body part, name tag and HP bar. Dead enemies stay hidden until respawn.
+     * Hidden entities cast no shadow, so the test is padded by the shadow
+     * reach. The frustum test runs over the packed position columns.
+     */
+    private cullEntities(culling: boolean): void {
+        const planes = this.frustum.planes;
+        const npcInView = culling ? this.npcPositions.withinFrustum(planes, CULL_RADIUS + SHADOW_REACH) : null;
+        for (let i = 0; i < this.npcs.length; i++) {
+            const mesh = this.npcs[i].mesh;
+            if (mesh) {
+                mesh.visible = !npcInView || npcInView[i] === 1;
+            }
+        }
+
+        const enemyInView = culling ? this.enemyPositions.withinFrustum(planes, CULL_RADIUS + SHADOW_REACH) : null;
+        for (let i = 0; i < this.enemies.length; i++) {
+            const enemy = this.enemies[i];
+            if (enemy.mesh && !enemy.isDead) {
+                enemy.mesh.visible = !enemyInView || enemyInView[i] === 1;
+            }
+        }
+    }
+
     /**
      * Update world (called every frame)
+     * Off-screen entities are hidden from the renderer and still simulate,
+     * but skip cosmetic work (walk animation, billboarding) that nobody can see. Entities outside the
+     * activation radius around the player are frozen until it comes closer;
+     * dead enemies keep counting down to respawn and enemies in combat
+     * always update.
+     *
+     * Wander AI runs at half the frame rate: even-indexed entities update on
+     * one frame and odd-indexed on the next. Each entity steps by the time
+     * since its own last step, so enemies leaving combat (which update every
+     * frame) are not stepped twice for one frame, and entities frozen outside
+     * the activation radius do not catch up on time they sat out. Standing
+     * NPCs that are not yet due to wander only advance their idle timer.
      */
     update(delta: number, player: Player): void {
+        this.cullEntities(this.updateFrustum());
+        const px = player.position.x;
+        const pz = player.position.z;
+        const now = Date.now();
+
+        this.aiParity ^= 1;
+        const clock = (this.aiClock += delta);
+
         // Update NPCs
-        for (const npc of this.npcs) {
-            npc.update(delta);
+        const npcPositions = this.npcPositions;
+        const npcSteppedAt = this.npcSteppedAt;
+        const npcActive = npcPositions.withinRadius(px, pz, AI_ACTIVATION_RADIUS);
+        for (let i = this.aiParity; i < npcPositions.count; i += 2) {
+            const aiDelta = clock - npcSteppedAt[i];
+            npcSteppedAt[i] = clock;
+            if (!npcActive[i]) continue;
+
+            const npc = this.npcs[i];
+            if (npc.tickIdle(aiDelta)) continue;
+
+            npc.update(aiDelta, !npc.mesh || npc.mesh.visible, now);
+            npcPositions.set(i, npc.position.x, npc.position.z);
         }
 
         // Update enemies
-        for (const enemy of this.enemies) {
-            enemy.update(delta, player);
+        const enemyPositions = this.enemyPositions;
+        const enemySteppedAt = this.enemySteppedAt;
+        const enemyActive = enemyPositions.withinRadius(px, pz, AI_ACTIVATION_RADIUS);
+        for (let i = 0; i < enemyPositions.count; i++) {
+            const enemy = this.enemies[i];
+            if (!enemy.inCombat && (i & 1) !== this.aiParity) continue;
+
+            const enemyDelta = clock - enemySteppedAt[i];
+            enemySteppedAt[i] = clock;
+            if (!enemy.inCombat && !enemy.isDead && !enemyActive[i]) continue;
+
+            enemy.update(enemyDelta, player, !enemy.mesh || enemy.mesh.visible, now);
+            enemyPositions.set(i, enemy.position.x, enemy.position.z);
         }
     }
 
@@ -759,9 +1062,13 @@ export class Lumbridge {
      * Dispose of resources and clean up
      */
     dispose(): void {
-        // Remove terrain from scene
+        // Remove terrain from scene and release its baked grass tile
         if (this.terrain && this.terrain.parent) {
             this.terrain.parent.remove(this.terrain);
+            const material = this.terrain.material as THREE.MeshStandardMaterial;
+            material.map?.dispose();
+            material.dispose();
+            this.terrain.geometry.dispose();
             this.terrain = null;
         }
 
@@ -772,6 +1079,18 @@ export class Lumbridge {
             }
         }
         this.buildings = [];
+        for (const geometry of this.mergedGeometries) {
+            geometry.dispose();
+        }
+        this.mergedGeometries = [];
+
+        // Release shared building geometry/materials
+        disposeAll(BUILDING_GEOMETRIES);
+        disposeAll(BUILDING_MATERIALS);
+
+        // Release geometry/materials shared by all NPCs and enemies
+        NPC.disposeShared();
+        Enemy.disposeShared();
 
         // Remove NPC meshes from scene and clear array
         for (const npc of this.npcs) {
@@ -788,6 +1107,8 @@ export class Lumbridge {
             }
         }
         this.enemies = [];
+        this.npcPositions = new EntityPositions(0);
+        this.enemyPositions = new EntityPositions(0);
 
         // Clear resources array
         this.resources = [];
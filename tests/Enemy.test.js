@@ -4,6 +4,7 @@
 
 import { Enemy } from '../src/entities/Enemy.ts';
 import { ITEMS } from '../src/utils/Constants.ts';
+import { getEntity, getEntityType } from '../src/types/guards.ts';
 
 describe('Enemy', () => {
     describe('Initialization', () => {
@@ -83,12 +84,58 @@ describe('Enemy', () => {
             expect(enemy.hpBarFill).toBeDefined();
         });
 
+        test('should parent the HP fill to the background so it billboards with it', () => {
+            const enemy = new Enemy(0, 0, 'CHICKEN');
+
+            expect(enemy.hpBarFill.parent).toBe(enemy.hpBarBg);
+        });
+
+        test('should resolve a hit on the HP fill to the enemy', () => {
+            const enemy = new Enemy(0, 0, 'CHICKEN');
+
+            expect(getEntityType(enemy.hpBarFill)).toBe('enemy');
+            expect(getEntity(enemy.hpBarFill)).toBe(enemy);
+        });
+
         test('should have body parts for animation', () => {
             const enemy = new Enemy(0, 0, 'CHICKEN');
 
             expect(enemy.bodyParts).toBeDefined();
             expect(enemy.bodyParts.body).toBeDefined();
         });
+
+        test('should share geometry and materials between enemies of the same species', () => {
+            const a = new Enemy(0, 0, 'GOBLIN_LEVEL_5');
+            const b = new Enemy(5, 5, 'GOBLIN_LEVEL_5');
+
+            expect(a.bodyParts.body.geometry).toBe(b.bodyParts.body.geometry);
+            expect(a.bodyParts.body.material).toBe(b.bodyParts.body.material);
+            expect(a.bodyParts.leftLeg.geometry).toBe(b.bodyParts.leftLeg.geometry);
+        });
+
+        test('should dispose shared resources and build fresh ones afterwards', () => {
+            const a = new Enemy(0, 0, 'GOBLIN_LEVEL_5');
+            const disposed = jest.fn();
+            a.bodyParts.body.geometry.addEventListener('dispose', disposed);
+
+            Enemy.disposeShared();
+            const b = new Enemy(5, 5, 'GOBLIN_LEVEL_5');
+
+            expect(disposed).toHaveBeenCalled();
+            expect(b.bodyParts.body.geometry).not.toBe(a.bodyParts.body.geometry);
+            expect(b.bodyParts.body.material).not.toBe(a.bodyParts.body.material);
+        });
+
+        test('should not recolor other enemies when one HP bar changes', () => {
+            const a = new Enemy(0, 0, 'COW');
+            const b = new Enemy(5, 5, 'COW');
+
+            a.currentHP = 1;
+            a.updateHPBar();
+
+            expect(a.hpBarFill.material.color.getHex()).toBe(0xFF0000);
+            expect(b.hpBarFill.material.color.getHex()).toBe(0x00FF00);
+        });
     });
 
     describe('Enemy types', () => {
@@ -461,6 +508,20 @@ describe('Enemy', () => {
                 expect(enemy.bodyParts.rightLeg.rotation.x).not.toBe(0);
             }
         });
+
+        test('should skip leg animation when off-screen', () => {
+            const enemy = new Enemy(0, 0, 'GOBLIN_LEVEL_2');
+
+            enemy.targetPosition = { x: 10, y: 0, z: 0 };
+            enemy.isWandering = true;
+
+            enemy.update(0.5, null, false);
+
+            // Still moves, but legs are not animated
+            expect(enemy.position.x).toBeGreaterThan(0);
+            expect(enemy.bodyParts.leftLeg.rotation.x).toBe(0);
+            expect(enemy.bodyParts.rightLeg.rotation.x).toBe(0);
+        });
     });
 
     describe('Combat behavior', () => {
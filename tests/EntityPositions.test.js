@@ -0,0 +1,80 @@
+/**
+ * EntityPositions tests
+ */
+
+import { EntityPositions } from '../src/world/EntityPositions.ts';
+
+describe('EntityPositions', () => {
+    test('should copy entity positions into packed columns by index', () => {
+        const entities = [
+            { position: { x: 1, z: 2 } },
+            { position: { x: -3, z: 4 } }
+        ];
+
+        const positions = EntityPositions.from(entities);
+
+        expect(positions.count).toBe(2);
+        expect(positions.x[1]).toBe(-3);
+        expect(positions.z[1]).toBe(4);
+    });
+
+    test('should update a single entry with set', () => {
+        const positions = new EntityPositions(3);
+
+        positions.set(2, 5, -6);
+
+        expect(positions.x[2]).toBe(5);
+        expect(positions.z[2]).toBe(-6);
+        expect(positions.x[0]).toBe(0);
+    });
+
+    test('should compute squared ground distance to a point', () => {
+        const positions = EntityPositions.from([{ position: { x: 3, z: 4 } }]);
+
+        expect(positions.distanceSq(0, 0, 0)).toBe(25);
+    });
+
+    test('should mark entities inside a radius in one pass', () => {
+        const positions = EntityPositions.from([
+            { position: { x: 3, z: 4 } },
+            { position: { x: 30, z: 0 } },
+            { position: { x: -5, z: 0 } }
+        ]);
+
+        const inRange = positions.withinRadius(0, 0, 5);
+
+        expect(inRange).toBe(positions.inRange);
+        expect(Array.from(inRange)).toEqual([1, 0, 1]);
+    });
+
+    test('should keep radius queries correct after entities change grid cells', () => {
+        const positions = EntityPositions.from([
+            { position: { x: 0, z: 0 } },
+            { position: { x: 0, z: 0 } }
+        ]);
+
+        positions.set(0, 200, -130);
+        positions.set(1, 10, 10);
+
+        expect(Array.from(positions.withinRadius(200, -130, 5))).toEqual([1, 0]);
+        expect(Array.from(positions.withinRadius(0, 0, 20))).toEqual([0, 1]);
+    });
+
+    test('should mark entities whose bounding sphere is inside every plane', () => {
+        const positions = EntityPositions.from([
+            { position: { x: 3, z: 0 } },
+            { position: { x: -10, z: 0 } },
+            { position: { x: -2, z: 0 } },
+            { position: { x: 3, z: 20 } }
+        ]);
+        const planes = [
+            { normal: { x: 1, z: 0 }, constant: 0 },   // x >= 0
+            { normal: { x: 0, z: -1 }, constant: 10 }  // z <= 10
+        ];
+
+        const inView = positions.withinFrustum(planes, 4);
+
+        expect(inView).toBe(positions.inView);
+        expect(Array.from(inView)).toEqual([1, 0, 1, 0]);
+    });
+});
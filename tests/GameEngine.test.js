@@ -483,6 +483,30 @@ describe('GameEngine', () => {
         });
     });
 
+    describe('Precompile', () => {
+        test('should compile the scene and upload each texture once', async () => {
+            const map = { isTexture: true };
+            const objects = [
+                { material: { map } },
+                { material: [{ map }, { map: null }] },
+                {}
+            ];
+            engine.renderer = { compileAsync: jest.fn(() => Promise.resolve()), initTexture: jest.fn() };
+            engine.scene = { traverse: (callback) => objects.forEach(callback) };
+            engine.camera = mockCamera;
+
+            await engine.precompile();
+
+            expect(engine.renderer.compileAsync).toHaveBeenCalledWith(engine.scene, mockCamera);
+            expect(engine.renderer.initTexture).toHaveBeenCalledTimes(1);
+            expect(engine.renderer.initTexture).toHaveBeenCalledWith(map);
+        });
+
+        test('should do nothing before init', async () => {
+            await expect(engine.precompile()).resolves.toBeUndefined();
+        });
+    });
+
     describe('Mouse and interaction', () => {
         test('should update mouse position on move', () => {
             const event = {
@@ -140,6 +140,16 @@ describe('GameEngine 64-bit Graphics', () => {
             // The renderer should be initialized
             expect(engine.renderer).not.toBeNull();
         });
+
+        test('should leave anti-aliasing to the FXAA pass', async () => {
+            const THREE = require('three');
+
+            await engine.init();
+
+            expect(THREE.WebGLRenderer).toHaveBeenCalledWith(
+                expect.objectContaining({ antialias: false })
+            );
+        });
     });
 
     describe('TEST-002: Render Target Configuration', () => {
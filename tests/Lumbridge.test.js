@@ -0,0 +1,43 @@
+/**
+ * Lumbridge world update tests
+ */
+
+import * as THREE from 'three';
+import { Lumbridge } from '../src/world/Lumbridge.ts';
+
+describe('Lumbridge', () => {
+    describe('update', () => {
+        let world;
+        let enemy;
+        let player;
+
+        beforeEach(() => {
+            world = new Lumbridge({ scene: new THREE.Scene(), camera: null });
+            world.createEnemies();
+            for (const e of world.enemies) {
+                jest.spyOn(e, 'update').mockImplementation(() => {});
+            }
+            enemy = world.enemies[0];
+            player = { position: enemy.position.clone() };
+        });
+
+        test('should not step an enemy leaving combat by the frame it already ran', () => {
+            enemy.inCombat = true;
+            world.update(0.1, player);
+            enemy.inCombat = false;
+            world.update(0.2, player);
+
+            expect(enemy.update).toHaveBeenCalledTimes(2);
+            expect(enemy.update.mock.calls[0][0]).toBeCloseTo(0.1);
+            expect(enemy.update.mock.calls[1][0]).toBeCloseTo(0.2);
+        });
+
+        test('should step idle enemies by the time of both frames at half rate', () => {
+            world.update(0.1, player);
+            world.update(0.2, player);
+
+            expect(enemy.update).toHaveBeenCalledTimes(1);
+            expect(enemy.update.mock.calls[0][0]).toBeCloseTo(0.3);
+        });
+    });
+});
@@ -4,6 +4,7 @@
 
 import { NPC } from '../src/entities/NPC.ts';
 import { NPC_TYPES } from '../src/utils/Constants.ts';
+import { RandomTable } from '../src/utils/RandomTable.ts';
 
 describe('NPC', () => {
     describe('Initialization', () => {
@@ -66,6 +67,29 @@ describe('NPC', () => {
             expect(npc.bodyParts.leftLeg).toBeDefined();
             expect(npc.bodyParts.rightLeg).toBeDefined();
         });
+
+        test('should bake static part matrices and keep the legs animated', () => {
+            const npc = new NPC(0, 0, NPC_TYPES.HANS);
+            const { leftLeg, rightLeg } = npc.bodyParts;
+            const staticParts = npc.mesh.children.filter(part => part !== leftLeg && part !== rightLeg);
+
+            expect(staticParts.length).toBeGreaterThan(0);
+            expect(staticParts.every(part => !part.matrixAutoUpdate)).toBe(true);
+            expect(leftLeg.matrixAutoUpdate).toBe(true);
+            expect(rightLeg.matrixAutoUpdate).toBe(true);
+        });
+
+        test('should dispose shared materials and build fresh ones afterwards', () => {
+            const a = new NPC(0, 0, NPC_TYPES.HANS);
+            const disposed = jest.fn();
+            a.bodyParts.leftLeg.material.addEventListener('dispose', disposed);
+
+            NPC.disposeShared();
+            const b = new NPC(5, 5, NPC_TYPES.HANS);
+
+            expect(disposed).toHaveBeenCalled();
+            expect(b.bodyParts.leftLeg.material).not.toBe(a.bodyParts.leftLeg.material);
+        });
     });
 
     describe('setupNPCType', () => {
@@ -231,6 +255,19 @@ describe('NPC', () => {
             }
         });
 
+        test('should reuse the same vector for successive wander targets', () => {
+            const randomSpy = jest.spyOn(RandomTable, 'next').mockReturnValue(0.5);
+            const npc = new NPC(0, 0, NPC_TYPES.HANS);
+
+            npc.update(10);
+            const firstTarget = npc.targetPosition;
+            npc.update(10);
+
+            expect(firstTarget).not.toBeNull();
+            expect(npc.targetPosition).toBe(firstTarget);
+            randomSpy.mockRestore();
+        });
+
         test('should stop wandering when reaching target', () => {
             const npc = new NPC(0, 0, NPC_TYPES.HANS);
 
@@ -292,6 +329,20 @@ describe('NPC', () => {
             expect(npc.bodyParts.rightLeg.rotation.x).not.toBe(0);
         });
 
+        test('should skip leg animation when off-screen', () => {
+            const npc = new NPC(0, 0, NPC_TYPES.HANS);
+
+            npc.targetPosition = { x: 10, y: 0, z: 0 };
+            npc.isWandering = true;
+
+            npc.update(0.1, false);
+
+            // Still moves, but legs are not animated
+            expect(npc.position.x).toBeGreaterThan(0);
+            expect(npc.bodyParts.leftLeg.rotation.x).toBe(0);
+            expect(npc.bodyParts.rightLeg.rotation.x).toBe(0);
+        });
+
         test('should reset leg rotation when stopped', () => {
             const npc = new NPC(0, 0, NPC_TYPES.HANS);
 
@@ -340,6 +391,19 @@ describe('NPC', () => {
             expect(npc.mesh.position.z).toBe(10);
         });
 
+        test('should only advance the idle timer while not due to wander', () => {
+            const npc = new NPC(0, 0, NPC_TYPES.HANS);
+            npc.wanderCooldown = 5;
+
+            expect(npc.tickIdle(1)).toBe(true);
+            expect(npc.wanderTimer).toBe(1);
+            expect(npc.tickIdle(4)).toBe(false);
+            expect(npc.wanderTimer).toBe(1);
+
+            npc.isWandering = true;
+            expect(npc.tickIdle(0.1)).toBe(false);
+        });
+
         test('should update mesh rotation', () => {
             const npc = new NPC(0, 0, NPC_TYPES.HANS);
 
@@ -0,0 +1,76 @@
+/**
+ * NameTagCache tests
+ */
+
+import * as THREE from 'three';
+import { NameTagCache } from '../src/utils/NameTagCache.ts';
+import { NPC } from '../src/entities/NPC.ts';
+import { Enemy } from '../src/entities/Enemy.ts';
+
+describe('NameTagCache', () => {
+    afterEach(() => {
+        NameTagCache.clear();
+    });
+
+    test('should return the same material for the same label', () => {
+        const a = NameTagCache.getMaterial('Guard', '#FFFF00', 'Bold 24px Arial');
+        const b = NameTagCache.getMaterial('Guard', '#FFFF00', 'Bold 24px Arial');
+
+        expect(a).not.toBeNull();
+        expect(a).toBe(b);
+        expect(NameTagCache.size()).toBe(1);
+    });
+
+    test('should key materials by text, color and font', () => {
+        const a = NameTagCache.getMaterial('Goblin (5)', '#FF0000', 'Bold 20px Arial');
+        const b = NameTagCache.getMaterial('Goblin (5)', '#FFFF00', 'Bold 20px Arial');
+        const c = NameTagCache.getMaterial('Goblin (5)', '#FF0000', 'Bold 24px Arial');
+
+        expect(a).not.toBe(b);
+        expect(a).not.toBe(c);
+        expect(NameTagCache.size()).toBe(3);
+    });
+
+    test('should create distinct sprites sharing one material', () => {
+        const a = NameTagCache.createSprite('Man', '#FFFF00', 'Bold 24px Arial');
+        const b = NameTagCache.createSprite('Man', '#FFFF00', 'Bold 24px Arial');
+
+        expect(a).not.toBe(b);
+        expect(a.material).toBe(b.material);
+    });
+
+    test('should share name tags between entities with the same name', () => {
+        const guard1 = new NPC(0, 0, 'GUARD', 'Guard');
+        const guard2 = new NPC(5, 5, 'GUARD', 'Guard');
+        const chicken1 = new Enemy(0, 0, 'CHICKEN');
+        const chicken2 = new Enemy(1, 1, 'CHICKEN');
+
+        const tag = (entity) => entity.mesh.children.find(child => child.isSprite);
+
+        expect(tag(guard1).material).toBe(tag(guard2).material);
+        expect(chicken1.nameSprite.material).toBe(chicken2.nameSprite.material);
+    });
+
+    test('should create sRGB textures without mipmaps', () => {
+        const material = NameTagCache.getMaterial('Cook', '#FFFF00', 'Bold 24px Arial');
+
+        expect(material.map.colorSpace).toBe(THREE.SRGBColorSpace);
+        expect(material.map.generateMipmaps).toBe(false);
+        expect(material.map.minFilter).toBe(THREE.LinearFilter);
+    });
+
+    test('should blend name tags so text edges stay antialiased', () => {
+        const material = NameTagCache.getMaterial('Hans', '#FFFF00', 'Bold 24px Arial');
+
+        expect(material.transparent).toBe(true);
+        expect(material.alphaTest).toBe(0);
+    });
+
+    test('should empty the cache on clear', () => {
+        NameTagCache.getMaterial('Hans', '#FFFF00', 'Bold 24px Arial');
+
+        NameTagCache.clear();
+
+        expect(NameTagCache.size()).toBe(0);
+    });
+});
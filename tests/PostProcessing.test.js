@@ -181,14 +181,33 @@ describe('PostProcessingManager', () => {
             expect(mockComposer.render).toHaveBeenCalled();
         });
 
-        test('should render directly when disabled', () => {
+        test('should keep rendering through the composer (FXAA) when effects are disabled', () => {
             ppManager.init();
             ppManager.setEnabled(false);
             ppManager.render();
 
+            expect(mockComposer.render).toHaveBeenCalled();
+            expect(mockRenderer.render).not.toHaveBeenCalled();
+            expect(ppManager.passes.bloom.enabled).toBe(false);
+            expect(ppManager.passes.ssao.enabled).toBe(false);
+            expect(ppManager.passes.fxaa.enabled).not.toBe(false);
+        });
+
+        test('should render directly when there is no composer', () => {
+            ppManager.render();
+
             expect(mockRenderer.render).toHaveBeenCalledWith(mockScene, mockCamera);
         });
 
+        test('should re-enable effect passes', () => {
+            ppManager.init();
+            ppManager.setEnabled(false);
+            ppManager.setEnabled(true);
+
+            expect(ppManager.passes.bloom.enabled).toBe(true);
+            expect(ppManager.passes.ssao.enabled).toBe(true);
+        });
+
         test('should toggle enabled state', () => {
             ppManager.setEnabled(false);
             expect(ppManager.enabled).toBe(false);
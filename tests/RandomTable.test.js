@@ -0,0 +1,47 @@
+/**
+ * RandomTable tests
+ */
+
+import { RandomTable } from '../src/utils/RandomTable.ts';
+
+describe('RandomTable', () => {
+    beforeEach(() => {
+        RandomTable.reseed();
+    });
+
+    test('should return values in [0, 1)', () => {
+        for (let i = 0; i < RandomTable.SIZE; i++) {
+            const value = RandomTable.next();
+            expect(value).toBeGreaterThanOrEqual(0);
+            expect(value).toBeLessThan(1);
+        }
+    });
+
+    test('should cycle back to the first value after SIZE draws', () => {
+        const first = RandomTable.next();
+        for (let i = 1; i < RandomTable.SIZE; i++) {
+            RandomTable.next();
+        }
+
+        expect(RandomTable.next()).toBe(first);
+    });
+
+    test('should scale values into the requested range', () => {
+        for (let i = 0; i < 100; i++) {
+            const value = RandomTable.range(3, 8);
+            expect(value).toBeGreaterThanOrEqual(3);
+            expect(value).toBeLessThan(8);
+        }
+    });
+
+    test('should restart from the beginning after reseed', () => {
+        RandomTable.next();
+        RandomTable.reseed();
+        const first = RandomTable.next();
+        for (let i = 1; i < RandomTable.SIZE; i++) {
+            RandomTable.next();
+        }
+
+        expect(RandomTable.next()).toBe(first);
+    });
+});
@@ -0,0 +1,31 @@
+/**
+ * ResourceCache tests
+ */
+
+import { getOrCreate, disposeAll } from '../src/utils/ResourceCache.ts';
+
+describe('ResourceCache', () => {
+    test('should create a value once and return it for later lookups', () => {
+        const cache = new Map();
+        const create = jest.fn(() => ({ dispose: jest.fn() }));
+
+        const first = getOrCreate(cache, 'rock', create);
+        const second = getOrCreate(cache, 'rock', create);
+
+        expect(second).toBe(first);
+        expect(create).toHaveBeenCalledTimes(1);
+        expect(cache.get('rock')).toBe(first);
+    });
+
+    test('should dispose every value and empty the cache', () => {
+        const cache = new Map();
+        const a = getOrCreate(cache, 'a', () => ({ dispose: jest.fn() }));
+        const b = getOrCreate(cache, 'b', () => ({ dispose: jest.fn() }));
+
+        disposeAll(cache);
+
+        expect(a.dispose).toHaveBeenCalled();
+        expect(b.dispose).toHaveBeenCalled();
+        expect(cache.size).toBe(0);
+    });
+});
@@ -211,6 +211,22 @@ describe('SkillsSystem', () => {
             Math.random.mockRestore();
         });
 
+        test('should not queue a resource that never depletes for respawn', () => {
+            jest.spyOn(Math, 'random').mockReturnValue(0.01); // Force success
+
+            mockResource.type = 'fishing_spot';
+            mockResource.hp = 1;
+            mockResource.deplete = jest.fn();
+            skillsSystem.addResource(mockResource);
+            skillsSystem.gatherResource(mockResource);
+            skillsSystem.gatherResource(mockResource);
+
+            expect(mockResource.deplete).toHaveBeenCalled();
+            expect(skillsSystem.depletedResources).toEqual([]);
+
+            Math.random.mockRestore();
+        });
+
         test('should show inventory full message when inventory is full', () => {
             jest.spyOn(Math, 'random').mockReturnValue(0.01); // Force success
 
@@ -369,6 +385,23 @@ describe('SkillsSystem', () => {
             expect(resource1.respawnTimer).toBe(7);
             expect(resource2.respawnTimer).toBe(2);
         });
+
+        test('should stop ticking a resource once it has respawned', () => {
+            const mockResource = {
+                depleted: true,
+                respawnTimer: 1,
+                respawn: jest.fn(() => {
+                    mockResource.depleted = false;
+                })
+            };
+
+            skillsSystem.addResource(mockResource);
+            skillsSystem.update(2);
+            skillsSystem.update(2);
+
+            expect(mockResource.respawn).toHaveBeenCalledTimes(1);
+            expect(mockResource.respawnTimer).toBe(-1);
+        });
     });
 
     describe('Integration tests', () => {
@@ -0,0 +1,58 @@
+/**
+ * Steering tests
+ */
+
+import * as THREE from 'three';
+import { Steering } from '../src/utils/Steering.ts';
+import { RandomTable } from '../src/utils/RandomTable.ts';
+
+describe('Steering', () => {
+    describe('pickWanderTarget', () => {
+        test('should write a point within the radius into the out vector', () => {
+            const origin = new THREE.Vector3(5, 0, -5);
+            const out = new THREE.Vector3();
+
+            for (let i = 0; i < 50; i++) {
+                const target = Steering.pickWanderTarget(origin, 10, out);
+                const distance = Math.sqrt(
+                    Math.pow(target.x - origin.x, 2) + Math.pow(target.z - origin.z, 2)
+                );
+
+                expect(target).toBe(out);
+                expect(target.y).toBe(0);
+                expect(distance).toBeLessThanOrEqual(10 + 1e-9);
+            }
+        });
+
+        test('should map the random roll onto the direction table', () => {
+            const randomSpy = jest.spyOn(RandomTable, 'next').mockReturnValue(0.25);
+            const target = Steering.pickWanderTarget({ x: 0, z: 0 }, 8, new THREE.Vector3());
+
+            // Quarter turn: straight along +Z, at a quarter of the radius
+            expect(target.x).toBeCloseTo(0);
+            expect(target.z).toBeCloseTo(2);
+            randomSpy.mockRestore();
+        });
+    });
+
+    describe('stepTowards', () => {
+        test('should move the position by the step length towards the target', () => {
+            const position = new THREE.Vector3(0, 0, 0);
+
+            const heading = Steering.stepTowards(position, { x: 10, z: 0 }, 2, 0.3);
+
+            expect(position.x).toBeCloseTo(2);
+            expect(position.z).toBeCloseTo(0);
+            expect(heading).toBeCloseTo(Math.PI / 2);
+        });
+
+        test('should return null without moving when within arrive distance', () => {
+            const position = new THREE.Vector3(0, 0, 0);
+
+            const heading = Steering.stepTowards(position, { x: 0.1, z: 0 }, 2, 0.3);
+
+            expect(heading).toBeNull();
+            expect(position.x).toBe(0);
+        });
+    });
+});
@@ -0,0 +1,19 @@
+/**
+ * WorldBounds tests
+ */
+
+import { inWorldBounds } from '../src/utils/WorldBounds.ts';
+import { WORLD_BOUND } from '../src/utils/Constants.ts';
+
+describe('inWorldBounds', () => {
+    test('should accept points inside the square on both axes', () => {
+        expect(inWorldBounds(0, 0)).toBe(true);
+        expect(inWorldBounds(-WORLD_BOUND + 1, WORLD_BOUND - 1)).toBe(true);
+    });
+
+    test('should reject points on or past the edge of either axis', () => {
+        expect(inWorldBounds(WORLD_BOUND, 0)).toBe(false);
+        expect(inWorldBounds(0, -WORLD_BOUND)).toBe(false);
+        expect(inWorldBounds(-WORLD_BOUND - 5, 0)).toBe(false);
+    });
+});
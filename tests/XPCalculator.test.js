@@ -25,6 +25,14 @@ describe('XPCalculator', () => {
         test('should return level 99 for max XP', () => {
             expect(XPCalculator.getLevelFromXP(14000000)).toBe(99);
         });
+
+        test('should change level exactly at each XP threshold', () => {
+            for (let level = 2; level <= 99; level++) {
+                const threshold = XPCalculator.getXPForLevel(level);
+                expect(XPCalculator.getLevelFromXP(threshold - 1)).toBe(level - 1);
+                expect(XPCalculator.getLevelFromXP(threshold)).toBe(level);
+            }
+        });
     });
 
     describe('getXPForLevel', () => {
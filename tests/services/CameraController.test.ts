@@ -5,6 +5,7 @@
 
 import * as THREE from 'three';
 import { CameraController } from '../../src/services/CameraController';
+import { CameraController as GameCameraController } from '../../src/game/CameraController';
 import { CAMERA } from '../../src/utils/Constants';
 
 describe('CameraController', () => {
@@ -284,3 +285,45 @@ describe('CameraController', () => {
         });
     });
 });
+
+describe('CameraController (game follow camera)', () => {
+    let camera: THREE.PerspectiveCamera;
+    let player: { position: THREE.Vector3 };
+    let controller: GameCameraController;
+
+    beforeEach(() => {
+        camera = new THREE.PerspectiveCamera(75, 1, 0.1, 1000);
+        player = { position: new THREE.Vector3(10, 0, -5) };
+        controller = new GameCameraController({ camera, getPlayer: () => player as any });
+        controller.update();
+        jest.spyOn(camera, 'lookAt');
+    });
+
+    it('should skip the update while the player and orbit stay put', () => {
+        const before = camera.position.clone();
+
+        controller.update();
+
+        expect(camera.lookAt).not.toHaveBeenCalled();
+        expect(camera.position.equals(before)).toBe(true);
+    });
+
+    it('should follow when the player moves', () => {
+        const before = camera.position.clone();
+
+        player.position.x += 3;
+        controller.update();
+
+        expect(camera.lookAt).toHaveBeenCalledWith(player.position);
+        expect(camera.position.x).toBeCloseTo(before.x + 3);
+    });
+
+    it('should reposition when the orbit changes', () => {
+        const before = camera.position.clone();
+
+        controller.setRotation(Math.PI / 2);
+
+        expect(camera.lookAt).toHaveBeenCalledTimes(1);
+        expect(camera.position.equals(before)).toBe(false);
+    });
+});
@@ -170,6 +170,24 @@ describe('InputManager', () => {
             expect(distance).toBeCloseTo(expectedDistance, 3);
         });
 
+        it('should keep moving until every key for a direction is released', () => {
+            inputManager.setupControls();
+            window.dispatchEvent(new KeyboardEvent('keydown', { code: 'KeyW' }));
+            window.dispatchEvent(new KeyboardEvent('keydown', { code: 'ArrowUp' }));
+            window.dispatchEvent(new KeyboardEvent('keyup', { code: 'KeyW' }));
+
+            const player = createMockPlayer();
+            const combat = createMockCombatSystem();
+
+            inputManager.handleMovement(delta, player as any, combat as any);
+            expect(player.position.z).toBeCloseTo(-player.speed * delta, 5);
+
+            window.dispatchEvent(new KeyboardEvent('keyup', { code: 'ArrowUp' }));
+            const z = player.position.z;
+            inputManager.handleMovement(delta, player as any, combat as any);
+            expect(player.position.z).toBe(z);
+        });
+
         it('should update player rotation', () => {
             inputManager.setupControls();
             window.dispatchEvent(new KeyboardEvent('keydown', { code: 'KeyD' }));
@@ -5,6 +5,7 @@
 
 import * as THREE from 'three';
 import { InteractionHandler, IInteractionContext, GameClickDetail } from '../../src/services/InteractionHandler';
+import { Enemy } from '../../src/entities/Enemy';
 
 // Mock dependencies
 const createMockPlayer = () => ({
@@ -155,6 +156,19 @@ describe('InteractionHandler', () => {
             expect(mockContext.combatSystem.attackTarget).not.toHaveBeenCalled();
         });
 
+        it('should attack the enemy when its HP bar fill is clicked', () => {
+            const enemy = new Enemy(0, 0, 'GOBLIN_LEVEL_5');
+            const detail: GameClickDetail = {
+                object: enemy.hpBarFill!,
+                point: new THREE.Vector3(0, 0, 0),
+                button: 'left'
+            };
+
+            interactionHandler.handleClick(detail);
+
+            expect(mockContext.combatSystem.attackTarget).toHaveBeenCalledWith(enemy);
+        });
+
         it('should show context menu on right click', () => {
             const mockEnemy = { name: 'Goblin', level: 5 };
             const detail: GameClickDetail = {